@@ -14,6 +14,7 @@ Modules:
 
 from .tia_project_reader import TiaProjectReader, ProjectInfo
 from .tia_block_generator import TiaBlockGenerator, MemberDef, NetworkDef
+from .tia_block_generator import BlockSpec, generate_blocks_parallel
 from .tia_block_generator import BOOL, INT, DINT, REAL, LREAL, WORD, DWORD, STRING, TIME
 from .tia_tag_export import TiaTagExporter, TiaTagImporter, export_project_tags, csv_to_tag_table, csv_to_db
 from .tia_scl_generator import SclGenerator
@@ -27,6 +28,8 @@ __all__ = [
     "TiaBlockGenerator",
     "MemberDef",
     "NetworkDef",
+    "BlockSpec",
+    "generate_blocks_parallel",
     "SclGenerator",
     "BlockLibrary",
     "CrossReference",
@@ -22,20 +22,26 @@ Usage:
 """
 
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from xml.sax.saxutils import escape
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
-import uuid
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import itertools
+import random
 
 
 # ─── Constants ────────────────────────────────────────────────────────────────
 
 TIA_OPENNESS_NS = "http://www.siemens.com/automation/Openness/SW/Interface/v3"
 NAMESPACE_MAP = {
-    "": "http://www.siemens.com/automation/Openness/SW/Interface/v3",
+    "": TIA_OPENNESS_NS,
 }
 
+# Language of generated comments and network titles
+COMMENT_LANG = "de-DE"
+
 # Standard data types
 BOOL = "Bool"
 INT = "Int"
@@ -50,24 +56,49 @@ TIME = "Time"
 DATE_AND_TIME = "Date_And_Time"
 ARRAY = "Array"
 
+# Block type -> Openness element tag
+_BLOCK_TYPE_MAP = {
+    "OB": "SW.Blocks.OB",
+    "FB": "SW.Blocks.FB",
+    "FC": "SW.Blocks.FC",
+    "GlobalDB": "SW.Blocks.GlobalDB",
+    "DB": "SW.Blocks.GlobalDB",
+}
 
-# ─── Helper Functions ─────────────────────────────────────────────────────────
+# Interface section order per block type
+_OB_SECTIONS = ("Input", "Output", "InOut", "Temp", "Constant")
+_FB_SECTIONS = ("Input", "Output", "InOut", "Static", "Temp", "Constant")
+_FB_DEFAULT_SECTIONS = ("Input", "Output", "InOut", "Static", "Temp")
+_FC_SECTIONS = ("Input", "Output", "InOut", "Temp", "Return")
 
-def _indent_xml(elem: ET.Element) -> str:
-    """Pretty-print an XML element."""
-    rough = ET.tostring(elem, encoding="unicode", xml_declaration=False)
-    parsed = minidom.parseString(rough)
-    pretty = parsed.toprettyxml(indent="  ", encoding=None)
-    # Remove the XML declaration that minidom adds
-    lines = pretty.split("\n")
-    if lines[0].startswith("<?xml"):
-        lines = lines[1:]
-    return "\n".join(lines)
+# Element IDs: random per-process base so files from separate runs don't collide
+_ID_COUNTER = itertools.count(random.getrandbits(24))
 
 
+# ─── Helper Functions ─────────────────────────────────────────────────────────
+
 def _new_id() -> str:
     """Generate a unique ID for XML elements."""
-    return str(uuid.uuid4().int % 0xFFFFFFFF)
+    return str(next(_ID_COUNTER))
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_text(text: str) -> str:
+    """Escape element text. Cached: comments and start values repeat a lot."""
+    return escape(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _array_dtype(lower, upper, element_type: str) -> str:
+    """Datatype string for an Array member, e.g. "Array[0..9] of Int"."""
+    return f"Array[{lower}..{upper}] of {element_type}"
+
+
+def _text_node(tag: str, text: str) -> str:
+    """Format a leaf element the way ElementTree serializes it."""
+    if not text:
+        return f"<{tag} />"
+    return f"<{tag}>{_escape_text(text)}</{tag}>"
 
 
 # ─── Data Type Definitions ────────────────────────────────────────────────────
@@ -75,6 +106,11 @@ def _new_id() -> str:
 class MemberDef:
     """Definition of a block interface member (parameter or static variable)."""
 
+    __slots__ = (
+        "name", "data_type", "section", "initial_value", "comment",
+        "array_lower", "array_upper", "array_type",
+    )
+
     def __init__(
         self,
         name: str,
@@ -99,6 +135,8 @@ class MemberDef:
 class NetworkDef:
     """Definition of a program block network."""
 
+    __slots__ = ("title", "language", "code")
+
     def __init__(self, title: str, language: str = "SCL", code: str = ""):
         self.title = title
         self.language = language  # SCL, LAD, FBD, STL
@@ -149,25 +187,25 @@ class TiaBlockGenerator:
 
         # Interface
         interface = self._add_element(attr_list, "Interface")
-        sections = self._add_element(interface, "Sections",
-                                     xmlns="http://www.siemens.com/automation/Openness/SW/Interface/v3")
+        sections = self._add_element(interface, "Sections", {"xmlns": TIA_OPENNESS_NS})
 
         # Input section (OBs typically have a standard Temp section)
         if members:
-            for section_name in ["Input", "Output", "InOut", "Temp", "Constant"]:
-                section_members = [m for m in members if m.section == section_name]
+            by_section = self._group_by_section(members)
+            for section_name in _OB_SECTIONS:
+                section_members = by_section.get(section_name)
                 if section_members:
-                    section = self._add_element(sections, "Section", Name=section_name)
+                    section = self._add_element(sections, "Section", {"Name": section_name})
                     for m in section_members:
                         self._add_member(section, m)
         else:
             # Default Temp section for OB
-            temp_section = self._add_element(sections, "Section", Name="Temp")
+            temp_section = self._add_element(sections, "Section", {"Name": "Temp"})
             self._add_member(temp_section, MemberDef("Temp_OB_info", "Word", "Temp"))
 
         # Networks
         if networks:
-            self._add_networks(attr_list, networks, language)
+            self._add_networks(block, networks, language)
 
         self._document = doc
         self._root = block
@@ -221,21 +259,20 @@ class TiaBlockGenerator:
 
         # Interface with all sections
         interface = self._add_element(attr_list, "Interface")
-        sections = self._add_element(interface, "Sections",
-                                     xmlns="http://www.siemens.com/automation/Openness/SW/Interface/v3")
+        sections = self._add_element(interface, "Sections", {"xmlns": TIA_OPENNESS_NS})
 
         if members:
-            for section_name in ["Input", "Output", "InOut", "Static", "Temp", "Constant"]:
-                section_members = [m for m in members if m.section == section_name]
-                section = self._add_element(sections, "Section", Name=section_name)
-                for m in section_members:
+            by_section = self._group_by_section(members)
+            for section_name in _FB_SECTIONS:
+                section = self._add_element(sections, "Section", {"Name": section_name})
+                for m in by_section.get(section_name, ()):
                     self._add_member(section, m)
         else:
-            for section_name in ["Input", "Output", "InOut", "Static", "Temp"]:
-                self._add_element(sections, "Section", Name=section_name)
+            for section_name in _FB_DEFAULT_SECTIONS:
+                self._add_element(sections, "Section", {"Name": section_name})
 
         if networks:
-            self._add_networks(attr_list, networks, language)
+            self._add_networks(block, networks, language)
 
         self._document = doc
         return doc
@@ -272,23 +309,22 @@ class TiaBlockGenerator:
         attr_list = self._add_element(block, "AttributeList")
 
         interface = self._add_element(attr_list, "Interface")
-        sections = self._add_element(interface, "Sections",
-                                     xmlns="http://www.siemens.com/automation/Openness/SW/Interface/v3")
+        sections = self._add_element(interface, "Sections", {"xmlns": TIA_OPENNESS_NS})
 
         if members:
-            for section_name in ["Input", "Output", "InOut", "Temp", "Return"]:
-                section_members = [m for m in members if m.section == section_name]
-                section = self._add_element(sections, "Section", Name=section_name)
-                for m in section_members:
+            by_section = self._group_by_section(members)
+            for section_name in _FC_SECTIONS:
+                section = self._add_element(sections, "Section", {"Name": section_name})
+                for m in by_section.get(section_name, ()):
                     self._add_member(section, m)
         else:
-            for section_name in ["Input", "Output", "InOut", "Temp", "Return"]:
-                section = self._add_element(sections, "Section", Name=section_name)
+            for section_name in _FC_SECTIONS:
+                section = self._add_element(sections, "Section", {"Name": section_name})
                 if section_name == "Return":
                     self._add_member(section, MemberDef("Ret_Val", return_type, "Return"))
 
         if networks:
-            self._add_networks(attr_list, networks, language)
+            self._add_networks(block, networks, language)
 
         self._document = doc
         return doc
@@ -326,10 +362,9 @@ class TiaBlockGenerator:
             mem_layout.text = "Standard"
 
         interface = self._add_element(attr_list, "Interface")
-        sections = self._add_element(interface, "Sections",
-                                     xmlns="http://www.siemens.com/automation/Openness/SW/Interface/v3")
+        sections = self._add_element(interface, "Sections", {"xmlns": TIA_OPENNESS_NS})
 
-        static_section = self._add_element(sections, "Section", Name="Static")
+        static_section = self._add_element(sections, "Section", {"Name": "Static"})
         if members:
             for m in members:
                 self._add_member(static_section, m)
@@ -352,10 +387,10 @@ class TiaBlockGenerator:
             tags: List of dicts with keys: name, data_type, address, comment
         """
         doc = ET.Element("Document")
-        doc.set("xmlns", "http://www.siemens.com/automation/Openness/SW/Interface/v3")
+        doc.set("xmlns", TIA_OPENNESS_NS)
 
-        engineering = self._add_element(doc, "Engineering", version="V14")
-        tag_table = self._add_element(doc, "SW.Tags.PlcTagTable", ID="0")
+        engineering = self._add_element(doc, "Engineering", {"version": "V14"})
+        tag_table = self._add_element(doc, "SW.Tags.PlcTagTable", {"ID": "0"})
         attr_list = self._add_element(tag_table, "AttributeList")
         name_elem = self._add_element(attr_list, "Name")
         name_elem.text = name
@@ -363,7 +398,7 @@ class TiaBlockGenerator:
         object_list = self._add_element(tag_table, "ObjectList")
 
         for tag_def in tags:
-            tag = self._add_element(object_list, "SW.Tags.PlcTag", ID=_new_id())
+            tag = self._add_element(object_list, "SW.Tags.PlcTag", {"ID": _new_id()})
             tag_attrs = self._add_element(tag, "AttributeList")
 
             tag_name = self._add_element(tag_attrs, "Name")
@@ -378,12 +413,42 @@ class TiaBlockGenerator:
 
             if tag_def.get("comment"):
                 comment_elem = self._add_element(tag_attrs, "Comment")
-                ml_text = self._add_element(comment_elem, "MultiLanguageText", Lang="de-DE")
+                ml_text = self._add_element(comment_elem, "MultiLanguageText", {"Lang": COMMENT_LANG})
                 ml_text.text = tag_def["comment"]
 
         self._document = doc
         return doc
 
+    def save_tag_table(self, filepath: str, name: str, tags):
+        """
+        Write a PLC tag table straight to an XML file.
+
+        Produces the same file as create_tag_table() + save(), but streams
+        each tag to disk instead of building an element tree first - use it
+        for large tables. The generator's current document is not changed.
+
+        Args:
+            filepath: Output XML path
+            name: Tag table name
+            tags: Iterable of dicts with keys: name, data_type, address, comment
+        """
+        path = Path(filepath)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Binary mode like _write_document(): LF line endings on every platform
+        with open(path, "wb") as f:
+            f.writelines(chunk.encode("utf-8") for chunk in self._tag_table_chunks(name, tags))
+
+        print(f"Tag table saved to: {path}")
+
+    def tag_table_xml_string(self, name: str, tags) -> str:
+        """
+        Return a PLC tag table as an XML string without building an element tree.
+
+        Same output as create_tag_table() + to_xml_string(); see save_tag_table().
+        """
+        return "".join(self._tag_table_chunks(name, tags))
+
     # ── Network Helpers ───────────────────────────────────────────────────────
 
     @staticmethod
@@ -398,38 +463,79 @@ class TiaBlockGenerator:
 
     # ── Save ──────────────────────────────────────────────────────────────────
 
-    def save(self, filepath: str):
-        """Save the current block to an XML file."""
+    @property
+    def document(self) -> Optional[ET.Element]:
+        """The Document element of the most recently created block."""
+        return self._document
+
+    def save(self, filepath: str, indent: bool = True):
+        """
+        Save the current block to an XML file.
+
+        Args:
+            filepath: Output XML path
+            indent: Pretty-print the XML. The Openness importer ignores
+                    whitespace, so pass False for machine-only output -
+                    it skips a full tree walk and gives smaller files.
+        """
         if self._document is None:
             raise RuntimeError("No block created yet.")
 
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_document(self._document, path, indent)
 
-        tree = ET.ElementTree(self._document)
-        ET.indent(tree, space="  ")
+        print(f"Block saved to: {path}")
 
-        with open(path, "w", encoding="utf-8") as f:
-            f.write('<?xml version="1.0" encoding="utf-8"?>\n')
-            tree.write(f, encoding="unicode", xml_declaration=False)
+    def save_many(self, items, indent: bool = True):
+        """
+        Save several documents at once.
 
-        print(f"Block saved to: {path}")
+        Output directories are created once up front instead of per file.
 
-    def to_xml_string(self) -> str:
-        """Return the current block as an XML string."""
+        Args:
+            items: Iterable of (filepath, document) pairs, where document is
+                   the element returned by create_ob()/create_fb()/... or
+                   the `document` property
+            indent: Pretty-print the XML (see save())
+        """
+        items = [(Path(filepath), doc) for filepath, doc in items]
+        for directory in {path.parent for path, _ in items}:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        for path, doc in items:
+            self._write_document(doc, path, indent)
+
+        print(f"Saved {len(items)} block(s)")
+
+    def to_xml_string(self, indent: bool = True) -> str:
+        """Return the current block as an XML string (see save() for indent)."""
         if self._document is None:
             raise RuntimeError("No block created yet.")
-        ET.indent(self._document, space="  ")
+        if indent:
+            ET.indent(self._document, space="  ")
         return '<?xml version="1.0" encoding="utf-8"?>\n' + ET.tostring(
             self._document, encoding="unicode"
         )
 
     # ── Internal XML Helpers ──────────────────────────────────────────────────
 
+    @staticmethod
+    def _write_document(doc: ET.Element, path: Path, indent: bool = True):
+        """Write a Document element to an XML file."""
+        tree = ET.ElementTree(doc)
+        if indent:
+            ET.indent(tree, space="  ")
+
+        # Binary mode: ElementTree encodes straight to UTF-8, no text-wrapper copy
+        with open(path, "wb") as f:
+            f.write(b'<?xml version="1.0" encoding="utf-8"?>\n')
+            tree.write(f, encoding="utf-8", xml_declaration=False)
+
     def _create_document(self) -> ET.Element:
         """Create the root Document element."""
         doc = ET.Element("Document")
-        engineering = self._add_element(doc, "Engineering", version="V14")
+        engineering = self._add_element(doc, "Engineering", {"version": "V14"})
         return doc
 
     def _add_block(
@@ -443,15 +549,8 @@ class TiaBlockGenerator:
         version: str = "0.1",
     ) -> ET.Element:
         """Add a SW.Blocks.* element."""
-        type_map = {
-            "OB": "SW.Blocks.OB",
-            "FB": "SW.Blocks.FB",
-            "FC": "SW.Blocks.FC",
-            "GlobalDB": "SW.Blocks.GlobalDB",
-            "DB": "SW.Blocks.GlobalDB",
-        }
-        block = self._add_element(parent, type_map.get(block_type, f"SW.Blocks.{block_type}"),
-                                  ID=str(number))
+        block = self._add_element(parent, _BLOCK_TYPE_MAP.get(block_type, f"SW.Blocks.{block_type}"),
+                                  {"ID": str(number)})
 
         attr_list = self._add_element(block, "AttributeList")
 
@@ -467,24 +566,24 @@ class TiaBlockGenerator:
 
         if comment:
             comment_elem = self._add_element(attr_list, "Comment")
-            ml_text = self._add_element(comment_elem, "MultiLanguageText", Lang="de-DE")
+            ml_text = self._add_element(comment_elem, "MultiLanguageText", {"Lang": COMMENT_LANG})
             ml_text.text = comment
 
         return block
 
-    def _add_networks(self, parent: ET.Element, networks: list, default_language: str):
-        """Add CompileUnit (network) elements."""
-        object_list = self._add_element(parent.find("..") or parent, "ObjectList")
+    def _add_networks(self, block: ET.Element, networks: list, default_language: str):
+        """Add CompileUnit (network) elements to the block's ObjectList."""
+        object_list = self._add_element(block, "ObjectList")
 
         for idx, net in enumerate(networks):
             compile_unit = self._add_element(object_list, "SW.Blocks.CompileUnit",
-                                            ID=str(idx + 1))
+                                            {"ID": str(idx + 1)})
             cu_attrs = self._add_element(compile_unit, "AttributeList")
 
             # Network title
             if net.title:
                 title_elem = self._add_element(cu_attrs, "NetworkTitle")
-                ml_text = self._add_element(title_elem, "MultiLanguageText", Lang="de-DE")
+                ml_text = self._add_element(title_elem, "MultiLanguageText", {"Lang": COMMENT_LANG})
                 ml_text.text = net.title
 
             lang = net.language or default_language
@@ -503,12 +602,21 @@ class TiaBlockGenerator:
                 parts = self._add_element(flg_net, "Parts")
                 wires = self._add_element(flg_net, "Wires")
 
+    @staticmethod
+    def _group_by_section(members: list) -> dict:
+        """Bucket members by section name in a single pass (keeps input order)."""
+        by_section = {}
+        for m in members:
+            by_section.setdefault(m.section, []).append(m)
+        return by_section
+
     def _add_member(self, section: ET.Element, member: MemberDef):
         """Add a Member element to a section."""
-        m = self._add_element(section, "Member", Name=member.name, Datatype=member.data_type)
+        data_type = member.data_type
+        if data_type == ARRAY and member.array_type:
+            data_type = _array_dtype(member.array_lower, member.array_upper, member.array_type)
 
-        if member.data_type == ARRAY and member.array_type:
-            m.set("Datatype", f"Array[{member.array_lower}..{member.array_upper}] of {member.array_type}")
+        m = self._add_element(section, "Member", {"Name": member.name, "Datatype": data_type})
 
         if member.initial_value:
             start_val = self._add_element(m, "StartValue")
@@ -516,16 +624,54 @@ class TiaBlockGenerator:
 
         if member.comment:
             comment_elem = self._add_element(m, "Comment")
-            ml_text = self._add_element(comment_elem, "MultiLanguageText", Lang="de-DE")
+            ml_text = self._add_element(comment_elem, "MultiLanguageText", {"Lang": COMMENT_LANG})
             ml_text.text = member.comment
 
     @staticmethod
-    def _add_element(parent: ET.Element, tag: str, **attribs) -> ET.Element:
-        """Add a child element with attributes."""
-        elem = ET.SubElement(parent, tag)
-        for key, val in attribs.items():
-            elem.set(key, val)
-        return elem
+    def _tag_table_chunks(name: str, tags):
+        """Yield the (indented) tag table XML, one chunk per tag."""
+        yield (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            f'<Document xmlns="{TIA_OPENNESS_NS}">\n'
+            '  <Engineering version="V14" />\n'
+            '  <SW.Tags.PlcTagTable ID="0">\n'
+            "    <AttributeList>\n"
+            f"      {_text_node('Name', name)}\n"
+            "    </AttributeList>\n"
+        )
+
+        has_tags = False
+        for tag_def in tags:
+            if not has_tags:
+                yield "    <ObjectList>\n"
+                has_tags = True
+            parts = [
+                f'      <SW.Tags.PlcTag ID="{_new_id()}">\n'
+                "        <AttributeList>\n"
+                f"          {_text_node('Name', tag_def['name'])}\n"
+                f"          {_text_node('DataTypeName', tag_def['data_type'])}\n"
+            ]
+            if tag_def.get("address"):
+                parts.append(f"          {_text_node('LogicalAddress', tag_def['address'])}\n")
+            if tag_def.get("comment"):
+                parts.append(
+                    "          <Comment>\n"
+                    f'            <MultiLanguageText Lang="{COMMENT_LANG}">'
+                    f"{_escape_text(tag_def['comment'])}</MultiLanguageText>\n"
+                    "          </Comment>\n"
+                )
+            parts.append("        </AttributeList>\n      </SW.Tags.PlcTag>\n")
+            yield "".join(parts)
+
+        yield "    </ObjectList>\n" if has_tags else "    <ObjectList />\n"
+        yield "  </SW.Tags.PlcTagTable>\n</Document>"
+
+    @staticmethod
+    def _add_element(parent: ET.Element, tag: str, attribs: dict = None) -> ET.Element:
+        """Add a child element with an optional attribute dict."""
+        if attribs:
+            return ET.SubElement(parent, tag, attribs)
+        return ET.SubElement(parent, tag)
 
     @staticmethod
     def _add_text_element(parent: ET.Element, tag: str, text: str) -> ET.Element:
@@ -535,19 +681,83 @@ class TiaBlockGenerator:
         return elem
 
 
+# ─── Batch Generation ─────────────────────────────────────────────────────────
+
+class BlockSpec:
+    """One block for generate_blocks_parallel(): create_* kind, output file, arguments."""
+
+    __slots__ = ("kind", "filename", "kwargs")
+
+    def __init__(self, kind: str, filename: str, **kwargs):
+        self.kind = kind          # ob, fb, fc, db, tag_table
+        self.filename = filename  # relative to the output directory
+        self.kwargs = kwargs      # passed to TiaBlockGenerator.create_<kind>()
+
+
+_BLOCK_KINDS = ("ob", "fb", "fc", "db", "tag_table")
+
+
+def _generate_block_file(spec: BlockSpec, out_dir: str, author: str, indent: bool) -> str:
+    """Worker: build one block and write it to disk (only the path goes back)."""
+    gen = TiaBlockGenerator(author=author)
+    doc = getattr(gen, f"create_{spec.kind}")(**spec.kwargs)
+    path = Path(out_dir) / spec.filename
+    path.parent.mkdir(parents=True, exist_ok=True)
+    TiaBlockGenerator._write_document(doc, path, indent)
+    return str(path)
+
+
+def generate_blocks_parallel(
+    specs: list,
+    out_dir: str,
+    workers: int = None,
+    author: str = "Python Generator",
+    indent: bool = True,
+) -> list:
+    """
+    Generate many independent block XML files across a process pool.
+
+    Each worker builds its own TiaBlockGenerator and writes its file
+    directly, so no element trees are sent back to the parent process.
+    On Windows, call this from under an `if __name__ == "__main__":` guard.
+
+    Args:
+        specs: List of BlockSpec
+        out_dir: Output directory
+        workers: Number of processes (None = CPU count)
+        author: Author passed to each generator
+        indent: Pretty-print the XML (see TiaBlockGenerator.save())
+
+    Returns:
+        List of written file paths, in the order of specs
+    """
+    for spec in specs:
+        if spec.kind not in _BLOCK_KINDS:
+            raise ValueError(f"Unknown block kind '{spec.kind}'. Available: {', '.join(_BLOCK_KINDS)}")
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    job = functools.partial(_generate_block_file, out_dir=str(out_dir), author=author, indent=indent)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        paths = list(pool.map(job, specs))
+
+    print(f"Generated {len(paths)} block(s) in {out_dir}")
+    return paths
+
+
 # ─── CLI Entry Point ──────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
     # Demo: Generate example blocks
     gen = TiaBlockGenerator(author="TIA Tools Demo")
     output_dir = Path("./generated_blocks")
+    blocks = []
 
     # 1. OB1 - Main
     gen.create_ob1_main(networks=[
         gen.scl_network("Call Motor Control", '"FC_MotorControl"();'),
         gen.scl_network("Call Data Processing", '"FC_DataProcess"();'),
     ])
-    gen.save(str(output_dir / "Main_OB1.xml"))
+    blocks.append((output_dir / "Main_OB1.xml", gen.document))
 
     # 2. OB100 - Startup
     gen.create_ob100_startup(networks=[
@@ -557,7 +767,7 @@ if __name__ == "__main__":
             "DB_Outputs".Valve1_Open := FALSE;
         """),
     ])
-    gen.save(str(output_dir / "Startup_OB100.xml"))
+    blocks.append((output_dir / "Startup_OB100.xml", gen.document))
 
     # 3. FB - Motor Control
     gen.create_fb(
@@ -585,7 +795,7 @@ if __name__ == "__main__":
         ],
         comment="Motor control function block",
     )
-    gen.save(str(output_dir / "FB_MotorControl.xml"))
+    blocks.append((output_dir / "FB_MotorControl.xml", gen.document))
 
     # 4. FC - Data Processing
     gen.create_fc(
@@ -605,7 +815,7 @@ if __name__ == "__main__":
         return_type="Int",
         comment="Data processing function",
     )
-    gen.save(str(output_dir / "FC_DataProcess.xml"))
+    blocks.append((output_dir / "FC_DataProcess.xml", gen.document))
 
     # 5. DB - Global Data
     gen.create_db(
@@ -621,7 +831,7 @@ if __name__ == "__main__":
         ],
         comment="Global output data block",
     )
-    gen.save(str(output_dir / "DB_Outputs.xml"))
+    blocks.append((output_dir / "DB_Outputs.xml", gen.document))
 
     # 6. Tag Table
     gen.create_tag_table("IO_Tags", [
@@ -642,6 +852,8 @@ if __name__ == "__main__":
         {"name": "AO_Speed_Ref", "data_type": "Int", "address": "%QW64",
          "comment": "Speed reference analog output"},
     ])
-    gen.save(str(output_dir / "IO_Tags.xml"))
+    blocks.append((output_dir / "IO_Tags.xml", gen.document))
+
+    gen.save_many(blocks)
 
     print(f"\nAll example blocks generated in: {output_dir.resolve()}")
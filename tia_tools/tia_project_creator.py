@@ -25,9 +25,22 @@ Usage:
 
 import sys
 import os
+import asyncio
+import functools
+import json
+import logging
+import socket
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+from .tia_block_generator import TiaBlockGenerator
+
+logger = logging.getLogger(__name__)
+
 # TIA version to Openness DLL mapping
 TIA_VERSION_MAP = {
     "14.0": ("V14", r"C:\Program Files\Siemens\Automation\Portal V14\PublicAPI\V14"),
@@ -40,6 +53,16 @@ TIA_VERSION_MAP = {
     "20.0": ("V20", r"C:\Program Files\Siemens\Automation\Portal V20\PublicAPI\V20"),
 }
 
+# Common parent of all "Portal V*" install directories in TIA_VERSION_MAP
+_TIA_INSTALL_ROOT = r"C:\Program Files\Siemens\Automation"
+
+# TIA_VERSION_MAP entries, newest version first (numeric sort: "20.0" > "9.0")
+_TIA_VERSIONS_DESC = tuple(sorted(
+    TIA_VERSION_MAP.items(),
+    key=lambda kv: tuple(int(x) for x in kv[0].split(".")),
+    reverse=True,
+))
+
 # Common CPU order numbers
 CPU_CATALOG = {
     # S7-1500
@@ -57,17 +80,49 @@ CPU_CATALOG = {
     "CPU 1215C DC/DC/DC": "6ES7 215-1AG40-0XB0",
 }
 
+_KNOWN_ORDERS = frozenset(CPU_CATALOG.values())
+
 
+# TIA versions whose Openness DLLs were already added to this process
+_LOADED_VERSIONS = set()
+
+# System.IO.FileInfo, ImportOptions.Override and EngineeringException,
+# resolved by the first _load_openness() call
+_FileInfo = None
+_IMPORT_OVERRIDE = None
+_EngineeringException = None
+
+
+@functools.lru_cache(maxsize=1)
 def _detect_tia_version() -> Optional[str]:
-    """Auto-detect installed TIA Portal version."""
-    for ver, (_, path) in sorted(TIA_VERSION_MAP.items(), reverse=True):
-        if os.path.exists(path):
+    """Auto-detect installed TIA Portal version (cached; see cache_clear())."""
+    # One directory listing instead of a stat per known version
+    try:
+        with os.scandir(_TIA_INSTALL_ROOT) as it:
+            installed = {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        return None
+
+    for ver, (ver_tag, path) in _TIA_VERSIONS_DESC:
+        if f"Portal {ver_tag}" in installed and os.path.exists(path):
             return ver
     return None
 
 
 class TiaProjectCreator:
-    """Creates and configures TIA Portal projects via the Openness API."""
+    """
+    Creates and configures TIA Portal projects via the Openness API.
+
+    Openness is a single-threaded apartment (STA) API: start_tia() or
+    attach_to_running() marks the calling thread as STA, and every later
+    call on the creator must come from that same thread. Use either the
+    blocking methods on one thread, or start_tia_async() /
+    attach_to_running_async() together with the other *_async methods,
+    which all run on the creator's worker thread. Mixing the two raises
+    RuntimeError.
+    """
+
+    _compilable_type = None  # ICompilable .NET type, resolved on first compile()
 
     def __init__(self, tia_version: str = None):
         """
@@ -88,11 +143,18 @@ class TiaProjectCreator:
         self._project = None   # Current project
         self._plc_device = None
         self._plc_software = None
-        self._loaded = False
+        self._block_group = None       # Cached PlcSoftware wrappers, set by add_plc()
+        self._tag_table_group = None
+        self._external_sources = None
+        self._block_group_cache = None  # {name: subfolder} under "Program blocks", built lazily
+        self._executor = None  # Worker thread for the *_async methods
+        self._sta_thread = None  # Ident of the thread that started/attached TIA Portal
+        self._pending_scl_sources = []  # Staged external sources, see stage_scl_source()
 
     def _load_openness(self):
-        """Load the Siemens.Engineering DLL via pythonnet."""
-        if self._loaded:
+        """Load the Siemens.Engineering DLL via pythonnet (once per process)."""
+        version_key = sys.intern(self.tia_version)
+        if version_key in _LOADED_VERSIONS:
             return
 
         try:
@@ -120,7 +182,24 @@ class TiaProjectCreator:
         if os.path.exists(hmi_dll):
             clr.AddReference(hmi_dll)
 
-        self._loaded = True
+        global _FileInfo, _IMPORT_OVERRIDE, _EngineeringException
+        from System.IO import FileInfo
+        from Siemens.Engineering import EngineeringException, ImportOptions
+        _FileInfo = FileInfo
+        _IMPORT_OVERRIDE = ImportOptions.Override
+        _EngineeringException = EngineeringException
+
+        _LOADED_VERSIONS.add(version_key)
+
+    @staticmethod
+    def _ensure_sta_thread():
+        """Mark the calling thread as STA so Openness calls skip cross-apartment marshalling."""
+        from System.Threading import ApartmentState, Thread
+
+        thread = Thread.CurrentThread
+        if not thread.TrySetApartmentState(ApartmentState.STA):
+            # The apartment of a running thread can only be set once
+            logger.debug("Thread apartment already fixed as %s", thread.GetApartmentState())
 
     def start_tia(self, with_gui: bool = False):
         """
@@ -130,16 +209,20 @@ class TiaProjectCreator:
             with_gui: If True, start with the GUI visible (slower but allows interaction).
         """
         self._load_openness()
+        self._ensure_sta_thread()
+        self._sta_thread = threading.get_ident()
         from Siemens.Engineering import TiaPortal, TiaPortalMode
 
         mode = TiaPortalMode.WithUserInterface if with_gui else TiaPortalMode.WithoutUserInterface
-        print(f"Starting TIA Portal {self.tia_version} ({'GUI' if with_gui else 'headless'})...")
+        logger.info("Starting TIA Portal %s (%s)...", self.tia_version, "GUI" if with_gui else "headless")
         self._tia = TiaPortal(mode)
-        print("TIA Portal started.")
+        logger.info("TIA Portal started.")
 
     def attach_to_running(self):
         """Attach to an already running TIA Portal instance."""
         self._load_openness()
+        self._ensure_sta_thread()
+        self._sta_thread = threading.get_ident()
         from Siemens.Engineering import TiaPortal
 
         processes = TiaPortal.GetProcesses()
@@ -148,7 +231,7 @@ class TiaProjectCreator:
         self._tia = processes[0].Attach()
         if self._tia.Projects.Count > 0:
             self._project = self._tia.Projects[0]
-        print(f"Attached to TIA Portal (PID: {processes[0].Id})")
+        logger.info("Attached to TIA Portal (PID: %s)", processes[0].Id)
 
     def create_project(self, name: str, directory: str):
         """
@@ -160,14 +243,18 @@ class TiaProjectCreator:
         """
         if not self._tia:
             raise RuntimeError("TIA Portal not started. Call start_tia() first.")
+        if not os.path.isdir(directory):
+            raise NotADirectoryError(f"Project directory does not exist: {directory}")
+        if not os.access(directory, os.W_OK):
+            raise PermissionError(f"Project directory is not writable: {directory}")
 
         from Siemens.Engineering import ProjectComposition
         from System.IO import DirectoryInfo
 
         target_dir = DirectoryInfo(directory)
-        print(f"Creating project '{name}' in {directory}...")
+        logger.info("Creating project '%s' in %s...", name, directory)
         self._project = self._tia.Projects.Create(target_dir, name)
-        print(f"Project created: {self._project.Path}")
+        logger.info("Project created: %s", self._project.Path)
 
     def open_project(self, project_path: str):
         """
@@ -179,12 +266,10 @@ class TiaProjectCreator:
         if not self._tia:
             raise RuntimeError("TIA Portal not started. Call start_tia() first.")
 
-        from System.IO import FileInfo
-
-        file_info = FileInfo(project_path)
-        print(f"Opening project: {project_path}...")
+        file_info = _FileInfo(project_path)
+        logger.info("Opening project: %s...", project_path)
         self._project = self._tia.Projects.Open(file_info)
-        print("Project opened.")
+        logger.info("Project opened.")
 
     def add_plc(
         self,
@@ -198,18 +283,23 @@ class TiaProjectCreator:
 
         Args:
             name: PLC device name
-            order_number: Siemens order number (MLFB)
+            order_number: Siemens order number (MLFB), or a CPU_CATALOG name like "CPU 1516-3 PN/DP"
             firmware: Firmware version string
             station_name: Optional station name (defaults to "{name}_Station")
         """
         if not self._project:
             raise RuntimeError("No project open. Call create_project() or open_project() first.")
 
+        order_number = CPU_CATALOG.get(order_number, order_number)
+        if order_number not in _KNOWN_ORDERS:
+            # Not an error: CPU_CATALOG only lists common CPUs
+            logger.warning("Order number %s is not in CPU_CATALOG, passing it to TIA Portal as is", order_number)
+
         # Build the hardware identifier string
         # Format: "OrderNumber:6ES7 515-2FM01-0AB0/V2.1"
         hw_id = f"OrderNumber:{order_number}/{firmware}"
 
-        print(f"Adding PLC: {name} ({order_number}, FW {firmware})...")
+        logger.info("Adding PLC: %s (%s, FW %s)...", name, order_number, firmware)
 
         # For TIA V14+, use the DeviceComposition
         device = self._project.Devices.CreateWithItem(hw_id, name, station_name or f"{name}")
@@ -220,29 +310,34 @@ class TiaProjectCreator:
             software_container = self._get_software_container(device_item)
             if software_container:
                 self._plc_software = software_container
-                print(f"PLC software container found for {name}")
+                self._block_group = software_container.BlockGroup
+                self._tag_table_group = software_container.TagTableGroup
+                self._external_sources = software_container.ExternalSourceGroup.ExternalSources
+                self._block_group_cache = None
+                logger.info("PLC software container found for %s", name)
                 break
 
-        print(f"PLC '{name}' added successfully.")
+        logger.info("PLC '%s' added successfully.", name)
 
     def _get_software_container(self, device_item):
-        """Recursively find the PlcSoftware container in device items."""
-        from Siemens.Engineering import IEngineeringServiceProvider
+        """Find the PlcSoftware container in a device item tree (breadth-first)."""
         from Siemens.Engineering.SW import PlcSoftware
 
-        try:
-            software = device_item.GetService[PlcSoftware]()
-            if software:
-                return software
-        except Exception:
-            pass
-
-        # Recurse into sub-items
-        if hasattr(device_item, "DeviceItems"):
-            for sub_item in device_item.DeviceItems:
-                result = self._get_software_container(sub_item)
-                if result:
-                    return result
+        pending = deque([device_item])
+        while pending:
+            item = pending.popleft()
+            try:
+                software = item.GetService[PlcSoftware]()
+                if software:
+                    return software
+            except Exception:
+                pass
+
+            # Queue sub-items
+            try:
+                pending.extend(item.DeviceItems)
+            except AttributeError:
+                pass
         return None
 
     def import_block(self, xml_path: str, block_group: str = None):
@@ -253,49 +348,76 @@ class TiaProjectCreator:
             xml_path: Path to the XML file
             block_group: Optional subfolder name under "Program blocks"
         """
-        if not self._plc_software:
-            raise RuntimeError("No PLC added. Call add_plc() first.")
+        self.import_blocks([xml_path], block_group)
 
-        from System.IO import FileInfo
-        from Siemens.Engineering.SW.Blocks import PlcBlockComposition
+    def import_blocks(self, xml_paths: list, block_group: str = None):
+        """
+        Import several program blocks from TIA Openness XML files.
 
-        file_info = FileInfo(xml_path)
-        block_group_obj = self._plc_software.BlockGroup
+        The target block group is resolved once for the whole batch.
 
-        if block_group:
-            # Create or find subfolder
-            try:
-                block_group_obj = block_group_obj.Groups.Find(block_group)
-                if not block_group_obj:
-                    block_group_obj = self._plc_software.BlockGroup.Groups.Create(block_group)
-            except Exception:
-                block_group_obj = self._plc_software.BlockGroup.Groups.Create(block_group)
+        Args:
+            xml_paths: Paths to the XML files
+            block_group: Optional subfolder name under "Program blocks"
+        """
+        if not self._plc_software:
+            raise RuntimeError("No PLC added. Call add_plc() first.")
 
-        print(f"Importing block from {xml_path}...")
-        block_group_obj.Blocks.Import(file_info, ImportOptions.Override)
-        print("Block imported.")
+        import_block = self._resolve_block_group(block_group).Blocks.Import
+        for xml_path in xml_paths:
+            logger.info("Importing block from %s...", xml_path)
+            import_block(_FileInfo(xml_path), _IMPORT_OVERRIDE)
+        logger.info("%d block(s) imported.", len(xml_paths))
+
+    def _resolve_block_group(self, block_group: str = None):
+        """Return the "Program blocks" group or the named subfolder (created if missing)."""
+        if not block_group:
+            return self._block_group
+
+        # Enumerate existing subfolders once, create missing ones on demand
+        if self._block_group_cache is None:
+            self._block_group_cache = {group.Name: group for group in self._block_group.Groups}
+        block_group_obj = self._block_group_cache.get(block_group)
+        if block_group_obj is None:
+            block_group_obj = self._block_group.Groups.Create(block_group)
+            self._block_group_cache[block_group] = block_group_obj
+        return block_group_obj
 
     def import_scl_source(self, scl_path: str):
         """
         Import an SCL source file into the PLC software.
 
+        Args:
+            scl_path: Path to the .scl file
+        """
+        self.stage_scl_source(scl_path)
+        self.generate_staged_scl_sources()
+
+    def stage_scl_source(self, scl_path: str):
+        """
+        Add an SCL source file to the PLC software without generating blocks yet.
+
+        Call generate_staged_scl_sources() once all files are staged, so the
+        block generation runs as one pass over all sources.
+
         Args:
             scl_path: Path to the .scl file
         """
         if not self._plc_software:
             raise RuntimeError("No PLC added. Call add_plc() first.")
 
-        from System.IO import FileInfo
-
-        file_info = FileInfo(scl_path)
-        external_sources = self._plc_software.ExternalSourceGroup.ExternalSources
+        file_info = _FileInfo(scl_path)
 
-        print(f"Importing SCL source: {scl_path}...")
-        source = external_sources.CreateFromFile(Path(scl_path).name, file_info)
+        logger.info("Importing SCL source: %s...", scl_path)
+        source = self._external_sources.CreateFromFile(os.path.basename(scl_path), file_info)
+        self._pending_scl_sources.append(source)
 
-        # Generate blocks from source
-        source.GenerateBlocksFromSource()
-        print("SCL source imported and blocks generated.")
+    def generate_staged_scl_sources(self):
+        """Generate blocks from all SCL sources staged with stage_scl_source()."""
+        sources, self._pending_scl_sources = self._pending_scl_sources, []
+        for source in sources:
+            source.GenerateBlocksFromSource()
+        logger.info("Blocks generated from %d SCL source(s).", len(sources))
 
     def add_tag_table(self, name: str, tags: list):
         """
@@ -305,61 +427,137 @@ class TiaProjectCreator:
             name: Tag table name
             tags: List of dicts with keys: name, data_type, address, comment
                   e.g. [{"name": "Motor1", "data_type": "Bool", "address": "%Q0.0", "comment": "Motor 1 output"}]
+
+        Raises:
+            ValueError: If a tag table with this name already exists
         """
         if not self._plc_software:
             raise RuntimeError("No PLC added. Call add_plc() first.")
 
-        tag_table_group = self._plc_software.TagTableGroup
-        tag_table = tag_table_group.TagTables.Create(name)
-        print(f"Creating tag table '{name}' with {len(tags)} tags...")
-
-        for tag_def in tags:
-            tag = tag_table.Tags.Create(
-                tag_def["name"],
-                tag_def["data_type"],
-                tag_def.get("address", ""),
-            )
-            if tag_def.get("comment"):
-                tag.Comment.Items[0].Text = tag_def["comment"]
+        tag_table_group = self._tag_table_group
+        # The XML import uses ImportOptions.Override and would silently replace
+        # an existing table, where TagTables.Create() refuses duplicates
+        if tag_table_group.TagTables.Find(name) is not None:
+            raise ValueError(f"Tag table already exists: {name}")
+        logger.info("Creating tag table '%s' with %d tags...", name, len(tags))
 
-        print(f"Tag table '{name}' created.")
+        # One XML import instead of 1-2 Openness calls per tag
+        try:
+            self._import_tag_table_xml(tag_table_group, name, tags)
+        except (OSError, _EngineeringException) as e:
+            logger.warning("Tag table XML import failed (%s), creating tags one by one...", e)
+            tag_table = tag_table_group.TagTables.Create(name)
+            for tag_def in tags:
+                tag = tag_table.Tags.Create(
+                    tag_def["name"],
+                    tag_def["data_type"],
+                    tag_def.get("address", ""),
+                )
+                if tag_def.get("comment"):
+                    tag.Comment.Items[0].Text = tag_def["comment"]
+
+        logger.info("Tag table '%s' created.", name)
+
+    @staticmethod
+    def _import_tag_table_xml(tag_table_group, name: str, tags: list):
+        """Write the tags as tag table XML to a temp file and import it."""
+        xml = TiaBlockGenerator().tag_table_xml_string(name, tags)
+        with tempfile.NamedTemporaryFile("w", suffix=".xml", encoding="utf-8", delete=False) as f:
+            f.write(xml)
+        try:
+            tag_table_group.TagTables.Import(_FileInfo(f.name), _IMPORT_OVERRIDE)
+        finally:
+            os.remove(f.name)
 
     def compile(self, plc_name: str = None):
         """Compile the PLC software."""
         if not self._plc_software:
             raise RuntimeError("No PLC software available.")
 
-        print("Compiling PLC software...")
-        compiler = self._plc_software.GetService[
-            type(self._plc_software).GetType().Assembly.GetType(
-                "Siemens.Engineering.Compiler.ICompilable"
-            )
-        ]
-        result = self._plc_software.GetService[
-            self._plc_software.GetType().Assembly.GetType(
+        logger.info("Compiling PLC software...")
+        if TiaProjectCreator._compilable_type is None:
+            TiaProjectCreator._compilable_type = self._plc_software.GetType().Assembly.GetType(
                 "Siemens.Engineering.Compiler.ICompilable"
             )
-        ].Compile()
-        print(f"Compilation result: {'Success' if result.State == 0 else 'Failed'}")
+        result = self._plc_software.GetService[TiaProjectCreator._compilable_type]().Compile()
+        logger.info("Compilation result: %s", "Success" if result.State == 0 else "Failed")
         return result
 
     def save(self):
         """Save the current project."""
         if self._project:
-            print("Saving project...")
+            logger.info("Saving project...")
             self._project.Save()
-            print("Project saved.")
+            logger.info("Project saved.")
+
+    def close_project(self):
+        """Close the current project (without saving) but keep TIA Portal running."""
+        if self._project:
+            self._project.Close()
+            self._project = None
+        self._plc_device = None
+        self._plc_software = None
+        self._block_group = None
+        self._tag_table_group = None
+        self._external_sources = None
+        self._block_group_cache = None
+        self._pending_scl_sources = []
 
     def save_and_close(self):
         """Save and close the project and TIA Portal."""
         if self._project:
             self.save()
-            self._project.Close()
-            self._project = None
+            self.close_project()
         if self._tia:
             self._tia.Dispose()
             self._tia = None
-            print("TIA Portal closed.")
+            logger.info("TIA Portal closed.")
+        self._sta_thread = None
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    # Async variants: the blocking Openness call runs on a single worker
+    # thread per creator, so calls stay serialized (TIA Portal handles one
+    # request at a time) while the event loop is free for other work.
+
+    async def _run_async(self, func, *args, **kwargs):
+        """Run a blocking creator method on this creator's worker thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tia-openness")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(self._call_on_sta_thread, func, args, kwargs)
+        )
+
+    def _call_on_sta_thread(self, func, args, kwargs):
+        """Call func, refusing to touch a TIA Portal instance owned by another thread."""
+        if self._sta_thread is not None and threading.get_ident() != self._sta_thread:
+            raise RuntimeError(
+                "TIA Portal was started on another thread. Use start_tia_async() or "
+                "attach_to_running_async() with the *_async methods, or stay on the blocking API."
+            )
+        return func(*args, **kwargs)
+
+    async def start_tia_async(self, with_gui: bool = False):
+        """Async variant of start_tia(); the worker thread becomes the STA thread."""
+        return await self._run_async(self.start_tia, with_gui=with_gui)
+
+    async def attach_to_running_async(self):
+        """Async variant of attach_to_running(); the worker thread becomes the STA thread."""
+        return await self._run_async(self.attach_to_running)
+
+    async def import_block_async(self, xml_path: str, block_group: str = None):
+        """Async variant of import_block()."""
+        return await self._run_async(self.import_block, xml_path, block_group)
+
+    async def compile_async(self):
+        """Async variant of compile()."""
+        return await self._run_async(self.compile)
+
+    async def save_async(self):
+        """Async variant of save()."""
+        return await self._run_async(self.save)
 
     def __enter__(self):
         return self
@@ -400,23 +598,253 @@ def create_simple_project(
     """
     with TiaProjectCreator(tia_version=tia_version) as creator:
         creator.start_tia(with_gui=with_gui)
-        creator.create_project(project_name, project_dir)
-        creator.add_plc("PLC_1", order_number=cpu_order, firmware=cpu_firmware)
+        return _build_project(
+            creator, project_name, project_dir, cpu_order, cpu_firmware, block_xmls, scl_files, tags
+        )
+
+
+def _build_project(
+    creator: TiaProjectCreator,
+    project_name: str,
+    project_dir: str,
+    cpu_order: str = "6ES7 515-2FM01-0AB0",
+    cpu_firmware: str = "V2.1",
+    block_xmls: list = None,
+    scl_files: list = None,
+    tags: dict = None,
+):
+    """Create, fill and compile a project on an already started creator."""
+    creator.create_project(project_name, project_dir)
+    creator.add_plc("PLC_1", order_number=cpu_order, firmware=cpu_firmware)
+
+    if block_xmls:
+        creator.import_blocks(block_xmls)
+
+    if scl_files:
+        for scl_path in scl_files:
+            creator.stage_scl_source(scl_path)
+        creator.generate_staged_scl_sources()
+
+    if tags:
+        for table_name, tag_list in tags.items():
+            creator.add_tag_table(table_name, tag_list)
+
+    creator.compile()
+    return str(Path(project_dir) / project_name)
+
+
+async def create_simple_project_async(
+    project_name: str,
+    project_dir: str,
+    cpu_order: str = "6ES7 515-2FM01-0AB0",
+    cpu_firmware: str = "V2.1",
+    tia_version: str = None,
+    block_xmls: list = None,
+    scl_files: list = None,
+    tags: dict = None,
+    with_gui: bool = False,
+):
+    """
+    Async variant of create_simple_project() (same arguments and result).
+
+    The Openness calls still run one after another on the creator's worker
+    thread; awaiting them lets the caller prepare the next project or drive
+    a second TIA Portal instance in the meantime.
+    """
+    creator = TiaProjectCreator(tia_version=tia_version)
+    try:
+        await creator.start_tia_async(with_gui=with_gui)
+        await creator._run_async(creator.create_project, project_name, project_dir)
+        await creator._run_async(creator.add_plc, "PLC_1", order_number=cpu_order, firmware=cpu_firmware)
 
         if block_xmls:
-            for xml_path in block_xmls:
-                creator.import_block(xml_path)
+            await creator._run_async(creator.import_blocks, block_xmls)
 
         if scl_files:
             for scl_path in scl_files:
-                creator.import_scl_source(scl_path)
+                await creator._run_async(creator.stage_scl_source, scl_path)
+            await creator._run_async(creator.generate_staged_scl_sources)
 
         if tags:
             for table_name, tag_list in tags.items():
-                creator.add_tag_table(table_name, tag_list)
+                await creator._run_async(creator.add_tag_table, table_name, tag_list)
 
-        creator.compile()
+        await creator.compile_async()
         return str(Path(project_dir) / project_name)
+    finally:
+        await creator._run_async(creator.save_and_close)
+
+
+# ─── Daemon ───────────────────────────────────────────────────────────────────
+#
+# Loading the Openness DLLs and starting TIA Portal takes several seconds per
+# process. serve_daemon() pays that once and then builds projects on request.
+# Protocol: one JSON object per line in each direction,
+#   request  {"op": "add_plc", "args": [...], "kwargs": {...}}
+#   ack      {"ack": true}  (sent as soon as the request line is read)
+#   response {"ok": true, "result": ...} or {"ok": false, "error": "..."}
+
+DAEMON_PORT = 5551
+DAEMON_ACK_TIMEOUT = 5.0  # seconds to wait for the ack before giving up on a listener
+
+
+class DaemonUnavailableError(ConnectionError):
+    """No TIA daemon accepted the request (nothing listening, or not a daemon)."""
+
+# Creator methods a client may call; "create_simple_project" and "shutdown" are handled separately
+_DAEMON_METHODS = frozenset({
+    "create_project", "open_project", "add_plc", "import_block", "import_blocks",
+    "import_scl_source", "stage_scl_source", "generate_staged_scl_sources",
+    "add_tag_table", "compile", "save", "close_project",
+})
+
+
+def _json_result(value):
+    """Convert an Openness return value into something json.dumps() accepts."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_json_result(v) for v in value]
+    if hasattr(value, "State"):  # CompilerResult
+        return str(value.State)
+    return str(value)
+
+
+async def serve_daemon(
+    host: str = "127.0.0.1",
+    port: int = DAEMON_PORT,
+    tia_version: str = None,
+    with_gui: bool = False,
+):
+    """
+    Keep one TIA Portal instance running and execute creator commands sent over TCP.
+
+    Every command runs on the creator's single worker thread, so requests
+    from several connections are executed one at a time. The daemon only
+    checks the op name against a whitelist; bind it to localhost unless
+    the network is trusted.
+
+    Args:
+        host: Interface to listen on
+        port: TCP port to listen on
+        tia_version: TIA Portal version (auto-detect if None)
+        with_gui: Whether to show TIA Portal GUI
+    """
+    creator = TiaProjectCreator(tia_version=tia_version)
+    await creator.start_tia_async(with_gui=with_gui)
+    stop = asyncio.Event()
+    clients = set()  # open client writers, closed on shutdown
+
+    def build_and_close(*args, **kwargs):
+        # Always close, so a failed build does not leave a half-built project
+        # open for the next request; only a completed build is saved
+        try:
+            path = _build_project(creator, *args, **kwargs)
+            creator.save()
+            return path
+        finally:
+            creator.close_project()
+
+    async def handle(reader, writer):
+        clients.add(writer)
+        try:
+            while not stop.is_set():
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(b'{"ack": true}\n')
+                await writer.drain()
+                op = None
+                try:
+                    request = json.loads(line)
+                    op = request["op"]
+                    if op == "shutdown":
+                        result = None
+                    elif op == "create_simple_project":
+                        result = await creator._run_async(
+                            build_and_close, *request.get("args", ()), **request.get("kwargs", {})
+                        )
+                    elif op in _DAEMON_METHODS:
+                        result = await creator._run_async(
+                            getattr(creator, op), *request.get("args", ()), **request.get("kwargs", {})
+                        )
+                    else:
+                        raise ValueError(f"Unknown daemon op: {op}")
+                    response = {"ok": True, "result": _json_result(result)}
+                except Exception as e:
+                    logger.warning("Daemon command failed: %s", e)
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+                if op == "shutdown":
+                    stop.set()  # after the reply, so the requesting client gets it
+                    break
+        finally:
+            clients.discard(writer)
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    logger.info("TIA daemon listening on %s:%d", host, port)
+    try:
+        async with server:
+            await stop.wait()
+            # Server.wait_closed() waits for open connections (3.12+): drop
+            # idle clients so shutdown does not hang on them
+            for client in list(clients):
+                client.close()
+    finally:
+        await creator._run_async(creator.save_and_close)
+        logger.info("TIA daemon stopped.")
+
+
+def send_daemon_command(
+    op: str,
+    args: list = (),
+    kwargs: dict = None,
+    host: str = "127.0.0.1",
+    port: int = DAEMON_PORT,
+):
+    """
+    Send one command to a running serve_daemon() and return its result.
+
+    Args:
+        op: Creator method name, "create_simple_project" or "shutdown"
+        args: Positional arguments for the method
+        kwargs: Keyword arguments for the method
+        host: Daemon host
+        port: Daemon port
+
+    Returns:
+        The JSON-decoded result
+
+    Raises:
+        DaemonUnavailableError: If no daemon accepted the request (nothing
+            listening, no ack within DAEMON_ACK_TIMEOUT, or not a daemon)
+        ConnectionError: If the daemon dropped the connection after the ack
+        RuntimeError: If the command failed inside the daemon
+    """
+    request = {"op": op, "args": list(args), "kwargs": kwargs or {}}
+    try:
+        sock = socket.create_connection((host, port), timeout=DAEMON_ACK_TIMEOUT)
+    except OSError as e:
+        raise DaemonUnavailableError(f"No TIA daemon on {host}:{port}: {e}") from e
+    with sock, sock.makefile("rb") as f:
+        # Until the ack arrives the listener may be anything: keep the timeout
+        try:
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            ack = json.loads(f.readline())
+            if not isinstance(ack, dict) or ack.get("ack") is not True:
+                raise ValueError(f"unexpected reply {ack!r}")
+        except (OSError, ValueError) as e:
+            raise DaemonUnavailableError(f"No TIA daemon on {host}:{port}: {e}") from e
+        sock.settimeout(None)  # Acknowledged; compiling a project can take minutes
+        line = f.readline()
+    if not line:
+        raise ConnectionError("TIA daemon closed the connection without a response")
+    response = json.loads(line)
+    if not response["ok"]:
+        raise RuntimeError(f"TIA daemon: {response['error']}")
+    return response["result"]
 
 
 # ─── CLI ──────────────────────────────────────────────────────────────────────
@@ -425,25 +853,49 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Create TIA Portal projects from Python")
-    parser.add_argument("name", help="Project name")
-    parser.add_argument("directory", help="Target directory")
+    parser.add_argument("name", nargs="?", help="Project name")
+    parser.add_argument("directory", nargs="?", help="Target directory")
     parser.add_argument("--cpu", default="6ES7 515-2FM01-0AB0", help="CPU order number")
     parser.add_argument("--fw", default="V2.1", help="CPU firmware version")
     parser.add_argument("--tia-version", help="TIA Portal version (e.g., 14.0, 17.0)")
     parser.add_argument("--gui", action="store_true", help="Show TIA Portal GUI")
     parser.add_argument("--import-xml", nargs="+", help="XML block files to import")
     parser.add_argument("--import-scl", nargs="+", help="SCL source files to import")
+    parser.add_argument("--serve", action="store_true", help="Run as a daemon that keeps TIA Portal loaded")
+    parser.add_argument("--port", type=int, default=DAEMON_PORT, help="Daemon port (default: %(default)s)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Forward the build to a running daemon (falls back to a local build)")
 
     args = parser.parse_args()
-
-    result = create_simple_project(
-        project_name=args.name,
-        project_dir=args.directory,
-        cpu_order=args.cpu,
-        cpu_firmware=args.fw,
-        tia_version=args.tia_version,
-        block_xmls=args.import_xml,
-        scl_files=args.import_scl,
-        with_gui=args.gui,
-    )
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.serve:
+        asyncio.run(serve_daemon(port=args.port, tia_version=args.tia_version, with_gui=args.gui))
+        sys.exit(0)
+    if not args.name or not args.directory:
+        parser.error("name and directory are required unless --serve is given")
+
+    # Absolute paths: a daemon resolves relative paths against its own cwd
+    build_kwargs = {
+        "project_name": args.name,
+        "project_dir": os.path.abspath(args.directory),
+        "cpu_order": args.cpu,
+        "cpu_firmware": args.fw,
+        "block_xmls": [os.path.abspath(p) for p in args.import_xml] if args.import_xml else None,
+        "scl_files": [os.path.abspath(p) for p in args.import_scl] if args.import_scl else None,
+    }
+    result = None
+    if args.daemon:
+        try:
+            result = send_daemon_command("create_simple_project", kwargs=build_kwargs, port=args.port)
+            logger.info("Project built by TIA daemon on port %d", args.port)
+            if args.tia_version or args.gui:
+                logger.warning(
+                    "--tia-version/--gui were ignored: the daemon uses the TIA Portal instance "
+                    "it was started with (omit --daemon to build locally)"
+                )
+        except DaemonUnavailableError as e:
+            logger.warning("%s; building locally", e)
+    if result is None:
+        result = create_simple_project(tia_version=args.tia_version, with_gui=args.gui, **build_kwargs)
     print(f"\nProject created at: {result}")
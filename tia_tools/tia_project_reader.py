@@ -14,11 +14,16 @@ Usage:
     print(info.summary())
 """
 
+import mmap
 import struct
+import sys
 import zlib
 import sqlite3
+import os
 import re
+import functools
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
@@ -26,7 +31,11 @@ from typing import Optional
 
 # ─── Data Classes ─────────────────────────────────────────────────────────────
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them (3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class DeviceInfo:
     name: str
     role: str
@@ -37,7 +46,7 @@ class DeviceInfo:
     description: str = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CpuInfo:
     name: str
     order_number: str
@@ -50,14 +59,14 @@ class CpuInfo:
     supported_languages: str = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LibraryRef:
     guid: str
     display_version: str
     switch_minor: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BlockInterface:
     """A member/parameter of a program block interface."""
     member_id: int
@@ -68,7 +77,7 @@ class BlockInterface:
     flags: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProgramBlock:
     """Represents a Safety / System function block found in the project."""
     name: str
@@ -76,7 +85,7 @@ class ProgramBlock:
     members: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProjectInfo:
     name: str = ""
     tia_version: str = ""
@@ -100,44 +109,43 @@ class ProjectInfo:
         if self.station_name:
             lines.append(f"  Station: {self.station_name}")
         if self.cpu:
-            lines += [
+            lines.extend((
                 f"  CPU: {self.cpu.name}",
                 f"    Order Number: {self.cpu.order_number}",
                 f"    Firmware: {self.cpu.firmware_version}",
                 f"    Subtype: {self.cpu.subtype}",
                 f"    Max Blocks: {self.cpu.max_blocks}",
                 f"    Languages: {self.cpu.supported_languages}",
-            ]
+            ))
         if self.devices:
             lines.append(f"\n  Hardware Components ({len(self.devices)}):")
-            for d in self.devices:
-                extra = f" [{d.order_number}]" if d.order_number else ""
-                lines.append(f"    - {d.name} (Role: {d.role}){extra}")
+            lines.extend(
+                f"    - {d.name} (Role: {d.role})" + (f" [{d.order_number}]" if d.order_number else "")
+                for d in self.devices
+            )
         if self.libraries:
             lines.append(f"\n  Libraries ({len(self.libraries)}):")
-            for lib in self.libraries:
-                lines.append(f"    - {lib.guid}  {lib.display_version}")
+            lines.extend(f"    - {lib.guid}  {lib.display_version}" for lib in self.libraries)
         if self.meta_packages:
             lines.append(f"\n  MetaInfo Packages ({len(self.meta_packages)}):")
-            for pkg in self.meta_packages:
-                lines.append(f"    - {pkg}")
+            lines.extend(f"    - {pkg}" for pkg in self.meta_packages)
         if self.blocks:
             lines.append(f"\n  Program Blocks ({len(self.blocks)}):")
-            for blk in self.blocks:
-                lines.append(f"    - {blk.name} ({blk.block_type}, {len(blk.members)} members)")
+            lines.extend(
+                f"    - {blk.name} ({blk.block_type}, {len(blk.members)} members)" for blk in self.blocks
+            )
         if self.timestamps:
             lines.append(f"\n  Timestamps: {self.timestamps[0]} ... {self.timestamps[-1]}")
         if self.xref_tables:
-            lines.append(f"\n  XRef Database:")
-            for table, count in self.xref_tables.items():
-                lines.append(f"    - {table}: {count} rows")
+            lines.append("\n  XRef Database:")
+            lines.extend(f"    - {table}: {count} rows" for table, count in self.xref_tables.items())
         lines.append("")
         return "\n".join(lines)
 
 
 # ─── PLF Header ───────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PlfHeader:
     header_size: int
     version: int
@@ -147,6 +155,139 @@ class PlfHeader:
     block_count: int
 
 
+# ─── Parser Patterns ──────────────────────────────────────────────────────────
+
+# zlib stream header: CMF byte 0x78 followed by one of the standard FLG bytes
+_ZLIB_CMF = b"\x78"
+_ZLIB_FLG = frozenset((0x01, 0x5E, 0x9C, 0xDA))
+_ZLIB_PROBE_SIZE = 64  # compressed bytes fed to the header probe
+_ZLIB_CHUNK_SIZE = 1 << 16  # compressed bytes fed per decompress() call
+_PARALLEL_MIN_CANDIDATES = 16  # below this, a thread pool costs more than it saves
+
+_AP_SUFFIX = re.compile(r"\.ap\d+$")
+_PACKAGE_NAME = re.compile(rb'Package name="([^"]+)"')
+_ORDER_NUMBER = re.compile(r"6ES\d")
+_CPU_NAME = re.compile(r"CPU \d{4}")
+_CPU_ORDER = re.compile(r"6ES7 \d{3}")
+_LIBRARY = re.compile(
+    rb'Library LibGuid="([^"]+)" DisplayVersion="([^"]+)"'
+    rb'(?:\s+SwitchMinor="([^"]*)")?'
+)
+# The gap before LID is one whitespace byte plus [^/]* (which already covers any
+# further whitespace): same matches as (?:\s+[^/]*)?\s*, without the ambiguous
+# \s+/[^/]*/\s* split that backtracks quadratically when LID is missing.
+_MEMBER = re.compile(
+    rb'<Member ID="(\d+)" Name="([^"]+)" RID="([^"]+)"'
+    rb'(?:\s+StdO="(\d+)")?'
+    rb'(?:\s[^/]*)?LID="(\d+)"'
+)
+# Interface page markers in priority order: (markers, block name, block type)
+_INTERFACE_MARKERS = (
+    ((b"F_PROG_DAT", b"F_RTG_DAT"), "SafeSys (F-System DB)", "OB"),
+    ((b"ChannelInfo",), "DiagnosticAlarm (OB82)", "OB"),
+    ((b"_dnVKE_", b"_lnCACHE"), "F_CTRL (Safety FB)", "FB"),
+    ((b"IdentXmlPart",), "Main (OB1)", "OB"),
+)
+
+# Bytes that can begin a printable UTF-8 string (printable ASCII or a multi-byte lead byte)
+_STRING_START = re.compile(rb"[\x20-\x7e\xc2-\xf4]")
+# ASCII control bytes; in UTF-8 they always encode non-printable characters
+_CONTROL_BYTE = re.compile(rb"[\x00-\x1f\x7f]")
+_TIMESTAMP = re.compile(rb'\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2} [AP]M')
+
+
+@functools.lru_cache(maxsize=None)
+def _attribute_pattern(attr_name: str) -> re.Pattern:
+    """Pattern for <Attribute Name="X" Type="T" Value="V" /> with an exact attribute name."""
+    return re.compile(
+        rb'<Attribute Name="' + re.escape(attr_name.encode()) + rb'" Type="[^"]*" Value="([^"]*)"'
+    )
+
+
+def _text(raw: bytes) -> str:
+    """Decode a captured field (pages are regexed as bytes, only captures become str)."""
+    return raw.decode("utf-8", errors="replace")
+
+
+# ─── zlib Streams ─────────────────────────────────────────────────────────────
+#
+# Shared with tia_tag_export, which scans the same PEData.plf layout.
+
+def scan_zlib_streams(data, mv: memoryview) -> list:
+    """
+    Decompress every zlib stream found in data.
+
+    Args:
+        data: PLF contents (bytes or mmap)
+        mv: memoryview over data, released by the caller
+
+    Returns:
+        [{"offset", "comp_size", "data", "size"}, ...] in file order
+    """
+    # 1. Header candidates that survive a cheap probe (false headers fail
+    #    within the first few bytes)
+    candidates = []
+    end = len(data) - 2
+    i = data.find(_ZLIB_CMF, 0, end)
+    while i >= 0:
+        if data[i + 1] in _ZLIB_FLG and _probe_zlib(mv, i):
+            candidates.append(i)
+        i = data.find(_ZLIB_CMF, i + 1, end)
+
+    # 2. Decompress the candidates; zlib releases the GIL while inflating,
+    #    so larger files are spread over a thread pool
+    if len(candidates) >= _PARALLEL_MIN_CANDIDATES:
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as pool:
+            results = list(pool.map(functools.partial(_inflate_at, mv), candidates))
+    else:
+        results = [_inflate_at(mv, offset) for offset in candidates]
+
+    # 3. Keep streams in file order, skipping candidates that lie inside
+    #    an already accepted stream
+    blocks = []
+    next_free = 0
+    for offset, result in zip(candidates, results):
+        if offset < next_free or result is None:
+            continue
+        decompressed, comp_size = result
+        if len(decompressed) >= 10:
+            blocks.append({
+                "offset": offset,
+                "comp_size": comp_size,
+                "data": decompressed,
+                "size": len(decompressed),
+            })
+            next_free = offset + comp_size
+    return blocks
+
+
+def _probe_zlib(mv: memoryview, offset: int) -> bool:
+    """Return False if the bytes at offset are certainly not a zlib stream."""
+    try:
+        zlib.decompressobj().decompress(mv[offset:offset + _ZLIB_PROBE_SIZE], 8)
+        return True
+    except zlib.error:
+        return False
+
+
+def _inflate_at(mv: memoryview, offset: int) -> Optional[tuple]:
+    """Decompress the stream at offset; return (data, compressed size) or None."""
+    # Feed bounded chunks: decompressing mv[offset:] in one call would make
+    # zlib copy the whole file tail into unused_data for every stream
+    obj = zlib.decompressobj()
+    parts = []
+    pos = offset
+    try:
+        while not obj.eof and pos < len(mv):
+            chunk = mv[pos:pos + _ZLIB_CHUNK_SIZE]
+            parts.append(obj.decompress(chunk))
+            pos += len(chunk)
+    except zlib.error:
+        return None
+    # A truncated stream counts as running to the end of the file
+    return b"".join(parts), pos - offset - len(obj.unused_data)
+
+
 # ─── Reader ───────────────────────────────────────────────────────────────────
 
 class TiaProjectReader:
@@ -157,9 +298,11 @@ class TiaProjectReader:
         # Support pointing to either the .ap14 parent or the inner folder
         if self.project_path.suffix in (".ap14", ".ap15", ".ap16", ".ap17", ".ap18", ".ap19", ".ap20"):
             self.project_path = self.project_path.parent
-        self._plf_data: bytes = b""
+        self._plf_data: bytes = b""  # PEData.plf contents (memory-mapped while read() runs)
+        self._plf_header: PlfHeader = PlfHeader(0, 0, b"", 0, 0, 0)  # parsed while mapped
         self._idx_data: bytes = b""
         self._zlib_blocks: list = []
+        self._blocks_by_kind: dict = {}
 
     def read(self) -> ProjectInfo:
         """Read the full project and return a ProjectInfo object."""
@@ -171,14 +314,24 @@ class TiaProjectReader:
         # 2. Read PEData.plf (binary database)
         plf_path = self.project_path / "System" / "PEData.plf"
         if plf_path.exists():
-            self._plf_data = plf_path.read_bytes()
-            self._extract_zlib_blocks()
+            with open(plf_path, "rb") as f:
+                # Map instead of read: the OS pages in only what the scan touches.
+                # The map is closed again before parsing (decompressed blocks are
+                # copies), so the project file is not held open. mmap cannot map
+                # an empty file, which is scanned as b"".
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as plf_map:
+                        self._plf_data = plf_map
+                        try:
+                            self._plf_header = self._parse_plf_header()
+                            self._extract_zlib_blocks()
+                        finally:
+                            self._plf_data = b""
+                else:
+                    self._extract_zlib_blocks()
             self._parse_meta_packages(info)
-            self._parse_devices(info)
-            self._parse_cpu_attributes(info)
+            self._parse_pages(info)
             self._parse_library_versions(info)
-            self._parse_block_interfaces(info)
-            self._parse_timestamps(info)
 
         # 3. Read XRef database
         xref_path = self.project_path / "XRef" / "XRef.db"
@@ -192,27 +345,23 @@ class TiaProjectReader:
     def _read_ap_file(self, info: ProjectInfo):
         """Parse the .ap14/.ap15/etc XML project file."""
         ap_files = list(self.project_path.glob("*.ap*"))
-        ap_files = [f for f in ap_files if re.match(r"\.ap\d+$", f.suffix)]
+        ap_files = [f for f in ap_files if _AP_SUFFIX.match(f.suffix)]
         if not ap_files:
             return
         ap_file = ap_files[0]
         try:
-            tree = ET.parse(str(ap_file))
-            root = tree.getroot()
-            ns = re.match(r"\{(.+?)\}", root.tag)
-            if ns:
-                info.name = root.get("Name", "")
-                info.tia_version = root.get("ProjectCompatibilityVersion", "")
-            else:
-                info.name = root.get("Name", "")
-                info.tia_version = root.get("ProjectCompatibilityVersion", "")
+            # Only the root element's attributes are needed: stop at its start tag
+            with open(ap_file, "rb") as f:
+                _, root = next(ET.iterparse(f, events=("start",)))
+            info.name = root.get("Name", "")
+            info.tia_version = root.get("ProjectCompatibilityVersion", "")
         except ET.ParseError:
             info.name = ap_file.stem
 
     # ── PLF Binary Parsing ────────────────────────────────────────────────────
 
     def _parse_plf_header(self) -> PlfHeader:
-        """Parse the 64-byte PLF header."""
+        """Parse the 64-byte PLF header (needs _plf_data, so read() keeps the result in _plf_header)."""
         if len(self._plf_data) < 64:
             return PlfHeader(0, 0, b"", 0, 0, 0)
         h = PlfHeader(
@@ -228,232 +377,216 @@ class TiaProjectReader:
     def _extract_zlib_blocks(self):
         """Find and decompress all zlib-compressed blocks in PLF."""
         data = self._plf_data
-        self._zlib_blocks = []
-        i = 0
-        while i < len(data) - 2:
-            if data[i] == 0x78 and data[i + 1] in (0x01, 0x5E, 0x9C, 0xDA):
-                try:
-                    obj = zlib.decompressobj()
-                    decompressed = obj.decompress(data[i:])
-                    comp_size = len(data[i:]) - len(obj.unused_data)
-                    if len(decompressed) >= 10:
-                        self._zlib_blocks.append({
-                            "offset": i,
-                            "comp_size": comp_size,
-                            "data": decompressed,
-                            "size": len(decompressed),
-                        })
-                        i += comp_size
-                        continue
-                except Exception:
-                    pass
-            i += 1
+        with memoryview(data) as mv:  # decompress from offsets without copying the file tail
+            self._zlib_blocks = scan_zlib_streams(data, mv)
+        self._classify_blocks()
 
-    def _find_blocks_containing(self, *patterns: bytes) -> list:
-        """Return decompressed blocks that contain all given byte patterns."""
-        results = []
+    def _classify_blocks(self):
+        """Sort the decompressed blocks (once) into the buckets the parsers consume."""
+        kinds = {"page": [], "meta": [], "library": []}
         for block in self._zlib_blocks:
-            if all(p in block["data"] for p in patterns):
-                results.append(block)
-        return results
+            data = block["data"]
+            if block["size"] == 4096:
+                kinds["page"].append(block)
+            if block["size"] > 10000 and b"<MetaInfo" in data[:200]:
+                kinds["meta"].append(block)
+            if b"<LibraryVersions" in data[:100]:
+                kinds["library"].append(block)
+        self._blocks_by_kind = kinds
 
     # ── MetaInfo Packages ─────────────────────────────────────────────────────
 
     def _parse_meta_packages(self, info: ProjectInfo):
         """Extract Package names from MetaInfo XML blocks."""
-        for block in self._zlib_blocks:
-            if block["size"] > 10000 and b"<MetaInfo" in block["data"][:200]:
-                text = block["data"].decode("utf-8", errors="replace")
-                packages = re.findall(r'Package name="([^"]+)"', text)
-                info.meta_packages.extend(packages)
+        for block in self._blocks_by_kind["meta"]:
+            info.meta_packages.extend(_text(p) for p in _PACKAGE_NAME.findall(block["data"]))
 
-    # ── Device Configuration ──────────────────────────────────────────────────
+    # ── Data Pages ────────────────────────────────────────────────────────────
 
-    def _parse_devices(self, info: ProjectInfo):
-        """Parse device/hardware info from data pages."""
-        for block in self._zlib_blocks:
-            if block["size"] != 4096:
-                continue
+    def _parse_pages(self, info: ProjectInfo):
+        """Parse all 4 KiB data pages in one pass, dispatching each page to its extractors."""
+        cpu_attrs = None
+        catalog_cpu = ("", "")
+        seen_timestamps = set(info.timestamps)
+        for block in self._blocks_by_kind["page"]:
             data = block["data"]
-            # Look for the device page pattern: length-prefixed strings with
-            # Role/Template/ObjectId markers
-            if b"S7PCentralStation" not in data:
-                continue
-
-            strings = self._extract_length_prefixed_strings(data)
-            if not strings:
-                continue
-
-            # Parse station name
-            for s in strings:
-                if "Station" in s and "/" in s:
-                    info.station_name = s
-                    break
+            if b"S7PCentralStation" in data:
+                self._parse_device_page(data, info)
+            if cpu_attrs is None and (b'Attribute Name="FwVersion"' in data or b'Name="Subtype"' in data):
+                cpu_attrs = self._parse_cpu_page(data)
+            if not all(catalog_cpu) and b"Siemens" in data and b"6ES7" in data:
+                catalog_cpu = self._parse_catalog_cpu(data, *catalog_cpu)
+            if b"<Root RIdSlots" in data:
+                self._parse_interface_page(data, info)
+            self._parse_page_timestamps(data, info, seen_timestamps)
+
+        # The CPU name falls back to the device list, so it is resolved after all pages
+        if cpu_attrs:
+            self._set_cpu(cpu_attrs, catalog_cpu, info)
 
-            # Parse device entries: they come in groups of
-            # (Role, <role>, Template, <template>, ObjectId, <id>)
-            i = 0
-            while i < len(strings) - 1:
-                if strings[i] == "Role" and i + 5 < len(strings):
-                    role = strings[i + 1] if i + 1 < len(strings) else ""
-                    template = ""
-                    obj_id = ""
-                    # Look ahead for Template and ObjectId
-                    for j in range(i + 2, min(i + 8, len(strings))):
-                        if strings[j] == "Template" and j + 1 < len(strings):
-                            template = strings[j + 1]
-                        if strings[j] == "ObjectId" and j + 1 < len(strings):
-                            obj_id = strings[j + 1]
-
-                    if role and template:
-                        info.devices.append(DeviceInfo(
-                            name="",  # filled below
-                            role=role,
-                            template=template,
-                            object_id=obj_id,
-                        ))
-                    i += 6
-                else:
-                    i += 1
-
-            # Parse hardware catalog entries (name, order number, manufacturer)
-            # Pattern: Manufacturer Name, Component Name, Order Number
-            catalog_entries = []
-            for s in strings:
-                if re.match(r"6ES7\s", s) or re.match(r"6ES\d", s):
-                    catalog_entries.append(s)
-
-            # Match device names from the initial string list
-            device_names = []
-            for s in strings:
-                if s.endswith("_1") or s.endswith("_2"):
-                    device_names.append(s)
-
-            # Assign names to devices where possible
-            for idx, dev in enumerate(info.devices):
-                if idx < len(device_names):
-                    # Try to find a matching name
-                    pass
-
-            # Also extract from the catalog section
-            self._parse_hardware_catalog(data, strings, info)
+    # ── Device Configuration ──────────────────────────────────────────────────
 
-    def _parse_hardware_catalog(self, data: bytes, strings: list, info: ProjectInfo):
-        """Extract hardware order numbers and descriptions."""
-        # Find patterns like "Siemens\x0eCPU 1515F-2 PN\x136ES7 515-2FM01-0AB0"
+    def _parse_device_page(self, data: bytes, info: ProjectInfo):
+        """Parse device/hardware info from a device page (S7PCentralStation)."""
+        strings = self._extract_length_prefixed_strings(data)
+        if not strings:
+            return
+
+        # Parse station name
+        for s in strings:
+            if "Station" in s and "/" in s:
+                info.station_name = s
+                break
+
+        # Parse device entries: they come in groups of
+        # (Role, <role>, Template, <template>, ObjectId, <id>)
         i = 0
-        while i < len(data) - 10:
-            # Look for "Siemens" followed by component description
-            if data[i:i + 7] == b"Siemens":
-                # Go backwards to find the name
-                # Go forwards to find order number
-                j = i + 7
-                if j < len(data):
-                    name_len = data[j]
-                    if 2 < name_len < 100 and j + 1 + name_len <= len(data):
-                        name = data[j + 1:j + 1 + name_len].decode("utf-8", errors="replace")
-                        k = j + 1 + name_len
-                        if k < len(data):
-                            order_len = data[k]
-                            if 5 < order_len < 50 and k + 1 + order_len <= len(data):
-                                order_num = data[k + 1:k + 1 + order_len].decode("utf-8", errors="replace")
-                                if re.match(r"6ES\d", order_num):
-                                    # Found a valid catalog entry
-                                    for dev in info.devices:
-                                        if not dev.order_number and dev.name == "":
-                                            dev.name = name
-                                            dev.order_number = order_num
-                                            dev.manufacturer = "Siemens"
-                                            break
-                i += 1
+        while i < len(strings) - 1:
+            if strings[i] == "Role" and i + 5 < len(strings):
+                role = strings[i + 1] if i + 1 < len(strings) else ""
+                template = ""
+                obj_id = ""
+                # Look ahead for Template and ObjectId
+                for j in range(i + 2, min(i + 8, len(strings))):
+                    if strings[j] == "Template" and j + 1 < len(strings):
+                        template = strings[j + 1]
+                    if strings[j] == "ObjectId" and j + 1 < len(strings):
+                        obj_id = strings[j + 1]
+
+                if role and template:
+                    info.devices.append(DeviceInfo(
+                        name="",  # filled below
+                        role=role,
+                        template=template,
+                        object_id=obj_id,
+                    ))
+                i += 6
             else:
                 i += 1
 
+        # Names and order numbers come from the catalog section
+        self._parse_hardware_catalog(data, strings, info)
+
+    def _parse_hardware_catalog(self, data: bytes, strings: list, info: ProjectInfo):
+        """Extract hardware order numbers and descriptions."""
+        # Find patterns like "Siemens\x0eCPU 1515F-2 PN\x136ES7 515-2FM01-0AB0"
+        end = len(data) - 10
+        i = data.find(b"Siemens")
+        while 0 <= i < end:
+            # Go forwards to find the name, then the order number
+            j = i + 7
+            name_len = data[j]
+            if 2 < name_len < 100 and j + 1 + name_len <= len(data):
+                name = data[j + 1:j + 1 + name_len].decode("utf-8", errors="replace")
+                k = j + 1 + name_len
+                if k < len(data):
+                    order_len = data[k]
+                    if 5 < order_len < 50 and k + 1 + order_len <= len(data):
+                        order_num = data[k + 1:k + 1 + order_len].decode("utf-8", errors="replace")
+                        if _ORDER_NUMBER.match(order_num):
+                            # Found a valid catalog entry
+                            for dev in info.devices:
+                                if not dev.order_number and dev.name == "":
+                                    dev.name = name
+                                    dev.order_number = order_num
+                                    dev.manufacturer = "Siemens"
+                                    break
+            # "Siemens" cannot overlap itself, so resume right after this one
+            i = data.find(b"Siemens", i + 7)
+
     def _extract_length_prefixed_strings(self, data: bytes) -> list:
         """Extract length-prefixed strings (1-byte length prefix) from binary data."""
         strings = []
+        # Hot loop: bind the per-iteration lookups to locals once
+        append = strings.append
+        search_start = _STRING_START.search
+        search_control = _CONTROL_BYTE.search
+        n = len(data)
         i = 0
-        while i < len(data) - 1:
+        while i < n - 1:
+            # A string's first character follows its length byte; skip every
+            # offset whose next byte cannot start a printable string
+            m = search_start(data, i + 1)
+            if m is None:
+                break
+            i = m.start() - 1
             length = data[i]
-            if 2 <= length <= 200 and i + 1 + length <= len(data):
-                try:
-                    s = data[i + 1:i + 1 + length].decode("utf-8")
-                    if s.isprintable() and len(s) >= 2:
-                        strings.append(s)
-                        i += 1 + length
+            end = i + 1 + length
+            if 2 <= length <= 200 and end <= n:
+                raw = data[i + 1:end]
+                # Byte-level prescreen: control bytes are never printable, so
+                # reject them before decoding; plain ASCII needs no isprintable()
+                if not search_control(raw):
+                    if raw.isascii():
+                        append(raw.decode("ascii"))
+                        i = end
                         continue
-                except (UnicodeDecodeError, ValueError):
-                    pass
+                    try:
+                        s = raw.decode("utf-8")
+                        if s.isprintable() and len(s) >= 2:
+                            append(s)
+                            i = end
+                            continue
+                    except (UnicodeDecodeError, ValueError):
+                        pass
             i += 1
         return strings
 
     # ── CPU Attributes ────────────────────────────────────────────────────────
 
-    def _parse_cpu_attributes(self, info: ProjectInfo):
-        """Extract CPU configuration attributes from MetaAttributes XML pages."""
-        for block in self._zlib_blocks:
-            if block["size"] != 4096:
-                continue
-            data = block["data"]
-            if b'Attribute Name="FwVersion"' not in data and b'Name="Subtype"' not in data:
-                continue
-            text = data.decode("utf-8", errors="replace")
-
-            fw_ver = self._extract_attr(text, "FwVersion")
-            subtype = self._extract_attr(text, "Subtype")
-            desc = self._extract_attr(text, "Description")
-            max_blocks = self._extract_attr(text, "IecplMaxNumberOfBlocks")
-            languages = self._extract_attr(text, "IecplSupportedLanguages")
-            max_mem = self._extract_attr(text, "IecplMaxMemory")
-
-            if fw_ver or subtype:
-                # Try to find CPU name from device catalog pages
-                cpu_name = ""
-                cpu_order = ""
-
-                # Search hardware catalog pages for CPU name + order number
-                for block2 in self._zlib_blocks:
-                    if block2["size"] != 4096:
-                        continue
-                    d2 = block2["data"]
-                    if b"Siemens" not in d2 or b"6ES7" not in d2:
-                        continue
-                    strs = self._extract_length_prefixed_strings(d2)
-                    for s in strs:
-                        # CPU name pattern: "CPU 1515F-2 PN", "CPU 1516-3 PN/DP" etc.
-                        if re.match(r"CPU \d{4}", s) and not cpu_name:
-                            cpu_name = s
-                        if re.match(r"6ES7 \d{3}", s) and not cpu_order:
-                            cpu_order = s
-                    if cpu_name and cpu_order:
-                        break
-
-                # Fallback: check device list
-                if not cpu_name:
-                    for dev in info.devices:
-                        if dev.order_number and "CPU" in dev.name:
-                            cpu_name = dev.name
-                            cpu_order = dev.order_number
-                            break
-
-                info.cpu = CpuInfo(
-                    name=cpu_name or "Unknown CPU",
-                    order_number=cpu_order,
-                    firmware_version=fw_ver or "",
-                    subtype=subtype or "",
-                    description=desc[:200] if desc else "",
-                    max_blocks=int(max_blocks) if max_blocks else 0,
-                    supported_languages=self._decode_languages(languages),
-                )
-                break
+    def _parse_cpu_page(self, data: bytes) -> Optional[dict]:
+        """Extract CPU configuration attributes from a MetaAttributes XML page."""
+        fw_ver = self._extract_attr(data, "FwVersion")
+        subtype = self._extract_attr(data, "Subtype")
+        if not (fw_ver or subtype):
+            return None
+        return {
+            "FwVersion": fw_ver,
+            "Subtype": subtype,
+            "Description": self._extract_attr(data, "Description"),
+            "IecplMaxNumberOfBlocks": self._extract_attr(data, "IecplMaxNumberOfBlocks"),
+            "IecplSupportedLanguages": self._extract_attr(data, "IecplSupportedLanguages"),
+        }
+
+    def _parse_catalog_cpu(self, data: bytes, cpu_name: str, cpu_order: str) -> tuple:
+        """Fill in whichever of CPU name / order number is still missing from a catalog page."""
+        for s in self._extract_length_prefixed_strings(data):
+            # CPU name pattern: "CPU 1515F-2 PN", "CPU 1516-3 PN/DP" etc.
+            if not cpu_name and _CPU_NAME.match(s):
+                cpu_name = s
+            if not cpu_order and _CPU_ORDER.match(s):
+                cpu_order = s
+        return cpu_name, cpu_order
+
+    def _set_cpu(self, attrs: dict, catalog_cpu: tuple, info: ProjectInfo):
+        """Build info.cpu from the CPU attributes plus the (name, order number) found in the catalog pages."""
+        cpu_name, cpu_order = catalog_cpu
+
+        # Fallback: check device list
+        if not cpu_name:
+            for dev in info.devices:
+                if dev.order_number and "CPU" in dev.name:
+                    cpu_name = dev.name
+                    cpu_order = dev.order_number
+                    break
+
+        desc = attrs["Description"]
+        max_blocks = attrs["IecplMaxNumberOfBlocks"]
+        info.cpu = CpuInfo(
+            name=cpu_name or "Unknown CPU",
+            order_number=cpu_order,
+            firmware_version=attrs["FwVersion"],
+            subtype=attrs["Subtype"],
+            description=desc[:200] if desc else "",
+            max_blocks=int(max_blocks) if max_blocks else 0,
+            supported_languages=self._decode_languages(attrs["IecplSupportedLanguages"]),
+        )
 
     @staticmethod
-    def _extract_attr(text: str, attr_name: str) -> str:
+    def _extract_attr(data: bytes, attr_name: str) -> str:
         """Extract Value from: <Attribute Name="X" Type="T" Value="V" />"""
-        # Use a precise pattern that matches the exact attribute name
-        pattern = rf'<Attribute Name="{re.escape(attr_name)}" Type="[^"]*" Value="([^"]*)"'
-        m = re.search(pattern, text)
-        return m.group(1) if m else ""
+        m = _attribute_pattern(attr_name).search(data)
+        return _text(m.group(1)) if m else ""
 
     @staticmethod
     def _decode_languages(lang_str: str) -> str:
@@ -468,96 +601,92 @@ class TiaProjectReader:
 
     def _parse_library_versions(self, info: ProjectInfo):
         """Extract library version references from LibraryVersions XML."""
-        for block in self._zlib_blocks:
-            if b"<LibraryVersions" in block["data"][:100]:
-                text = block["data"].decode("utf-8", errors="replace")
-                for m in re.finditer(
-                    r'Library LibGuid="([^"]+)" DisplayVersion="([^"]+)"'
-                    r'(?:\s+SwitchMinor="([^"]*)")?',
-                    text,
-                ):
-                    info.libraries.append(LibraryRef(
-                        guid=m.group(1),
-                        display_version=m.group(2),
-                        switch_minor=m.group(3) == "true" if m.group(3) else False,
-                    ))
+        for block in self._blocks_by_kind["library"]:
+            for m in _LIBRARY.finditer(block["data"]):
+                info.libraries.append(LibraryRef(
+                    guid=_text(m.group(1)),
+                    display_version=_text(m.group(2)),
+                    switch_minor=m.group(3) == b"true",
+                ))
 
     # ── Block Interfaces ──────────────────────────────────────────────────────
 
-    def _parse_block_interfaces(self, info: ProjectInfo):
-        """Extract program block interface definitions from data pages."""
-        for block in self._zlib_blocks:
-            if block["size"] != 4096:
-                continue
-            data = block["data"]
-            if b"<Root RIdSlots" not in data:
-                continue
-            text = data.decode("utf-8", errors="replace")
-
-            # Extract members
-            members = []
-            for m in re.finditer(
-                r'<Member ID="(\d+)" Name="([^"]+)" RID="([^"]+)"'
-                r'(?:\s+StdO="(\d+)")?'
-                r'(?:\s+[^/]*)?\s*LID="(\d+)"',
-                text,
-            ):
-                members.append(BlockInterface(
-                    member_id=int(m.group(1)),
-                    name=m.group(2),
-                    rid=m.group(3),
-                    offset=int(m.group(4)) if m.group(4) else -1,
-                    lid=int(m.group(5)),
-                ))
-
-            if members:
-                # Try to determine block name from context
-                block_name = "Unknown"
-                if b"F_PROG_DAT" in data or b"F_RTG_DAT" in data:
-                    block_name = "SafeSys (F-System DB)"
-                elif b"ChannelInfo" in data:
-                    block_name = "DiagnosticAlarm (OB82)"
-                elif b"_dnVKE_" in data or b"_lnCACHE" in data:
-                    block_name = "F_CTRL (Safety FB)"
-                elif b"IdentXmlPart" in data:
-                    block_name = "Main (OB1)"
-
-                info.blocks.append(ProgramBlock(
-                    name=block_name,
-                    block_type="FB" if "FB" in block_name or "F_" in block_name else "OB",
-                    members=members,
-                ))
+    def _parse_interface_page(self, data: bytes, info: ProjectInfo):
+        """Extract a program block interface definition from a data page (<Root RIdSlots)."""
+        # Extract members
+        members = []
+        for m in _MEMBER.finditer(data):
+            members.append(BlockInterface(
+                member_id=int(m.group(1)),
+                name=_text(m.group(2)),
+                rid=_text(m.group(3)),
+                offset=int(m.group(4)) if m.group(4) else -1,
+                lid=int(m.group(5)),
+            ))
+
+        if members:
+            # Try to determine block name from context
+            block_name, block_type = next(
+                (
+                    (name, block_type)
+                    for markers, name, block_type in _INTERFACE_MARKERS
+                    if any(marker in data for marker in markers)
+                ),
+                ("Unknown", "OB"),
+            )
+            info.blocks.append(ProgramBlock(name=block_name, block_type=block_type, members=members))
 
     # ── Timestamps ────────────────────────────────────────────────────────────
 
-    def _parse_timestamps(self, info: ProjectInfo):
-        """Extract timestamps from device pages."""
-        for block in self._zlib_blocks:
-            if block["size"] != 4096:
-                continue
-            data = block["data"]
-            # Pattern: "2/19/2026 11:20:55 AM"
-            for m in re.finditer(rb'\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2} [AP]M', data):
-                ts = m.group().decode("ascii")
-                if ts not in info.timestamps:
-                    info.timestamps.append(ts)
+    def _parse_page_timestamps(self, data: bytes, info: ProjectInfo, seen: set):
+        """Extract timestamps from a data page (seen: timestamps already in info.timestamps)."""
+        # Pattern: "2/19/2026 11:20:55 AM"
+        for m in _TIMESTAMP.finditer(data):
+            ts = m.group().decode("ascii")
+            if ts not in seen:
+                seen.add(ts)
+                info.timestamps.append(ts)
 
     # ── XRef Database ─────────────────────────────────────────────────────────
 
     def _read_xref(self, xref_path: Path, info: ProjectInfo):
         """Read the XRef SQLite database."""
         try:
-            conn = sqlite3.connect(str(xref_path))
+            # Read-only: never creates a journal or takes a write lock next to TIA Portal
+            conn = sqlite3.connect(xref_path.resolve().as_uri() + "?mode=ro", uri=True)
+        except Exception:
+            return
+        try:
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -64000")  # 64 MB
+            conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB
             cursor = conn.cursor()
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = cursor.fetchall()
-            for (table_name,) in tables:
-                cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
-                count = cursor.fetchone()[0]
-                info.xref_tables[table_name] = count
-            conn.close()
+            table_names = [name for (name,) in cursor.fetchall()]
+            if not table_names:
+                return
+            quoted = ['"' + name.replace('"', '""') + '"' for name in table_names]
+
+            # All row counts in one statement instead of one query per table
+            query = " UNION ALL ".join(
+                f"SELECT {idx}, COUNT(*) FROM {table}" for idx, table in enumerate(quoted)
+            )
+            try:
+                counts = dict(cursor.execute(query).fetchall())
+            except sqlite3.Error:
+                # One unreadable table (e.g. unknown virtual table module) fails the
+                # whole statement; count table by table to keep the readable ones
+                for table_name, table in zip(table_names, quoted):
+                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                    info.xref_tables[table_name] = cursor.fetchone()[0]
+                return
+            for idx, table_name in enumerate(table_names):
+                info.xref_tables[table_name] = counts[idx]
         except Exception:
             pass
+        finally:
+            conn.close()
 
 
 # ─── CLI Entry Point ──────────────────────────────────────────────────────────
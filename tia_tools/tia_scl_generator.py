@@ -34,6 +34,9 @@ Usage:
     scl.save("FB_Motor.scl")
 """
 
+import functools
+import itertools
+import os
 from pathlib import Path
 from textwrap import dedent
 from typing import Optional
@@ -51,10 +54,37 @@ _SECTION_KW = {
     "Constant": "VAR CONSTANT",
 }
 
-# Section ordering for FB/FC
-_FB_SECTION_ORDER = ["Input", "Output", "InOut", "Static", "Temp", "Constant"]
-_FC_SECTION_ORDER = ["Input", "Output", "InOut", "Temp", "Constant"]
-_OB_SECTION_ORDER = ["Temp"]
+# Section ordering for FB/FC, pre-resolved to (section, keyword) pairs
+_FB_SECTION_ORDER = tuple((s, _SECTION_KW[s]) for s in ("Input", "Output", "InOut", "Static", "Temp", "Constant"))
+_FC_SECTION_ORDER = tuple((s, _SECTION_KW[s]) for s in ("Input", "Output", "InOut", "Temp", "Constant"))
+_OB_SECTION_ORDER = (("Temp", _SECTION_KW["Temp"]),)
+
+# generate_many() block kinds -> builder method
+_BLOCK_BUILDERS = {
+    "fb": "function_block",
+    "fc": "function",
+    "ob": "organization_block",
+    "db": "data_block",
+    "idb": "instance_db",
+    "udt": "udt",
+}
+
+# Output buffer for save(): large enough to batch many blocks per write call
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Blocks are stored encoded as they would be written in text mode
+# (UTF-8, platform line endings), so every save method can write bytes as-is
+_NEWLINE = os.linesep.encode("ascii")
+
+# Block name -> file name: drop quotes, spaces become underscores
+_SAFE_NAME = str.maketrans({'"': None, " ": "_"})
+
+# save_separate() writes each file with raw os.open/os.write (no buffered file object)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# S7 attribute pragma per access mode
+_ATTR_OPTIMIZED = "{ S7_Optimized_Access := 'TRUE' }"
+_ATTR_STANDARD = "{ S7_Optimized_Access := 'FALSE' }"
 
 
 class SclGenerator:
@@ -66,9 +96,39 @@ class SclGenerator:
             version: Block version string (e.g. "0.1")
             optimized: S7_Optimized_Access attribute (True for S7-1500)
         """
-        self.version = version
-        self.optimized = optimized
-        self._blocks: list[tuple[str, str]] = []  # [(name, scl_text), ...]
+        self._version = version
+        self._optimized = optimized
+        self._build_header()
+        self._blocks: list[tuple[str, str, bytes]] = []  # [(name, scl_text, encoded), ...]
+
+    # ── Settings ──────────────────────────────────────────────────────────────
+
+    @property
+    def version(self) -> str:
+        """Block version string written to every following block."""
+        return self._version
+
+    @version.setter
+    def version(self, value: str):
+        self._version = value
+        self._build_header()
+
+    @property
+    def optimized(self) -> bool:
+        """S7_Optimized_Access attribute written to every following block."""
+        return self._optimized
+
+    @optimized.setter
+    def optimized(self, value: bool):
+        self._optimized = value
+        self._build_header()
+
+    def _build_header(self):
+        """Rebuild the cached header lines from the current settings."""
+        self._attr_line = _ATTR_OPTIMIZED if self._optimized else _ATTR_STANDARD
+        self._version_line = f"VERSION : {self._version}"
+        # Attribute pragma + VERSION as one entry (UDTs only carry the VERSION line)
+        self._header_tail = f"{self._attr_line}\n{self._version_line}"
 
     # ── Block Creation ────────────────────────────────────────────────────────
 
@@ -91,21 +151,19 @@ class SclGenerator:
             Generated SCL text
         """
         lines = [f'FUNCTION_BLOCK "{name}"']
-        lines.append(self._attributes())
-        lines.append(f"VERSION : {self.version}")
+        append = lines.append
+        append(self._header_tail)
         if comment:
-            lines.append(f"// {comment}")
+            append(_line_comment(comment))
 
         lines.extend(self._var_sections(members or [], _FB_SECTION_ORDER))
-        lines.append("")
-        lines.append("BEGIN")
-        lines.append(self._format_code(code))
-        lines.append("END_FUNCTION_BLOCK")
-        lines.append("")
-
-        text = "\n".join(lines)
-        self._blocks.append((name, text))
-        return text
+        append("")
+        append("BEGIN")
+        append(self._format_code(code))
+        append("END_FUNCTION_BLOCK")
+        append("")
+
+        return self._add_block(name, "\n".join(lines))
 
     def function(
         self,
@@ -129,21 +187,19 @@ class SclGenerator:
         """
         header = f'FUNCTION "{name}" : {return_type}'
         lines = [header]
-        lines.append(self._attributes())
-        lines.append(f"VERSION : {self.version}")
+        append = lines.append
+        append(self._header_tail)
         if comment:
-            lines.append(f"// {comment}")
+            append(_line_comment(comment))
 
         lines.extend(self._var_sections(members or [], _FC_SECTION_ORDER))
-        lines.append("")
-        lines.append("BEGIN")
-        lines.append(self._format_code(code))
-        lines.append("END_FUNCTION")
-        lines.append("")
-
-        text = "\n".join(lines)
-        self._blocks.append((name, text))
-        return text
+        append("")
+        append("BEGIN")
+        append(self._format_code(code))
+        append("END_FUNCTION")
+        append("")
+
+        return self._add_block(name, "\n".join(lines))
 
     def organization_block(
         self,
@@ -164,21 +220,19 @@ class SclGenerator:
             Generated SCL text
         """
         lines = [f'ORGANIZATION_BLOCK "{name}"']
-        lines.append(self._attributes())
-        lines.append(f"VERSION : {self.version}")
+        append = lines.append
+        append(self._header_tail)
         if comment:
-            lines.append(f"// {comment}")
+            append(_line_comment(comment))
 
         lines.extend(self._var_sections(members or [], _OB_SECTION_ORDER))
-        lines.append("")
-        lines.append("BEGIN")
-        lines.append(self._format_code(code))
-        lines.append("END_ORGANIZATION_BLOCK")
-        lines.append("")
-
-        text = "\n".join(lines)
-        self._blocks.append((name, text))
-        return text
+        append("")
+        append("BEGIN")
+        append(self._format_code(code))
+        append("END_ORGANIZATION_BLOCK")
+        append("")
+
+        return self._add_block(name, "\n".join(lines))
 
     def data_block(
         self,
@@ -197,26 +251,25 @@ class SclGenerator:
             Generated SCL text
         """
         lines = [f'DATA_BLOCK "{name}"']
-        lines.append(self._attributes())
-        lines.append(f"VERSION : {self.version}")
+        append = lines.append
+        append(self._header_tail)
         if comment:
-            lines.append(f"// {comment}")
-        lines.append("")
+            append(_line_comment(comment))
+        append("")
 
         # DB always uses VAR section
         if members:
-            lines.append("VAR")
+            append("VAR")
+            member_line = self._member_line
             for m in members:
-                lines.append(self._member_line(m))
-            lines.append("END_VAR")
-        lines.append("")
-        lines.append("BEGIN")
-        lines.append("END_DATA_BLOCK")
-        lines.append("")
-
-        text = "\n".join(lines)
-        self._blocks.append((name, text))
-        return text
+                append(member_line(m))
+            append("END_VAR")
+        append("")
+        append("BEGIN")
+        append("END_DATA_BLOCK")
+        append("")
+
+        return self._add_block(name, "\n".join(lines))
 
     def instance_db(
         self,
@@ -235,20 +288,18 @@ class SclGenerator:
             Generated SCL text
         """
         lines = [f'DATA_BLOCK "{name}"']
-        lines.append(self._attributes())
-        lines.append(f"VERSION : {self.version}")
-        lines.append(f'"{fb_name}"')
-        lines.append("")
-        lines.append("BEGIN")
+        append = lines.append
+        append(self._header_tail)
+        append(f'"{fb_name}"')
+        append("")
+        append("BEGIN")
         if overrides:
             for var, val in overrides.items():
-                lines.append(f"   {var} := {val};")
-        lines.append("END_DATA_BLOCK")
-        lines.append("")
+                append(f"   {var} := {val};")
+        append("END_DATA_BLOCK")
+        append("")
 
-        text = "\n".join(lines)
-        self._blocks.append((name, text))
-        return text
+        return self._add_block(name, "\n".join(lines))
 
     def udt(
         self,
@@ -267,21 +318,21 @@ class SclGenerator:
             Generated SCL text
         """
         lines = [f'TYPE "{name}"']
-        lines.append(f"VERSION : {self.version}")
+        append = lines.append
+        append(self._version_line)
         if comment:
-            lines.append(f"// {comment}")
-        lines.append("")
-        lines.append("STRUCT")
+            append(_line_comment(comment))
+        append("")
+        append("STRUCT")
+        member_line = self._member_line
         for m in (members or []):
-            lines.append(self._member_line(m))
-        lines.append("END_STRUCT;")
-        lines.append("")
-        lines.append("END_TYPE")
-        lines.append("")
-
-        text = "\n".join(lines)
-        self._blocks.append((name, text))
-        return text
+            append(member_line(m))
+        append("END_STRUCT;")
+        append("")
+        append("END_TYPE")
+        append("")
+
+        return self._add_block(name, "\n".join(lines))
 
     def function_block_with_idb(
         self,
@@ -309,11 +360,43 @@ class SclGenerator:
         idb_text = self.instance_db(idb_name, fb_name, overrides)
         return fb_text + "\n" + idb_text
 
+    def generate_many(self, specs) -> str:
+        """
+        Generate many blocks in one call.
+
+        Args:
+            specs: Iterable of (kind, kwargs) pairs, e.g. ("fb", {"name": "FB_Motor", "members": [...]});
+                kind is one of fb, fc, ob, db, idb, udt and kwargs go to the matching builder
+        Returns:
+            Combined SCL text of the generated blocks
+        """
+        specs = list(specs)
+        for kind, _ in specs:
+            if kind not in _BLOCK_BUILDERS:
+                raise ValueError(f"Unknown block kind '{kind}'. Available: {', '.join(_BLOCK_BUILDERS)}")
+
+        # Resolve each builder once instead of per spec
+        builders = {kind: getattr(self, method) for kind, method in _BLOCK_BUILDERS.items()}
+        return "\n".join([builders[kind](**kwargs) for kind, kwargs in specs])
+
+    @staticmethod
+    def members_from_rows(rows) -> list[MemberDef]:
+        """
+        Build MemberDefs in bulk from positional tuples (e.g. rows read from a CSV).
+
+        Args:
+            rows: Iterable of tuples in MemberDef argument order:
+                (name, data_type[, section, initial_value, comment, array_lower, array_upper, array_type])
+        Returns:
+            List of MemberDef
+        """
+        return list(itertools.starmap(MemberDef, rows))
+
     # ── Output ────────────────────────────────────────────────────────────────
 
     def to_string(self) -> str:
         """Get all generated blocks as a single SCL string."""
-        return "\n".join(text for _, text in self._blocks)
+        return "\n".join([text for _, text, _ in self._blocks])
 
     def save(self, filepath: str):
         """
@@ -324,9 +407,26 @@ class SclGenerator:
         """
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(self.to_string(), encoding="utf-8")
+        with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            self.save_stream(f)
         print(f"Saved {len(self._blocks)} block(s) to {path}")
 
+    def save_stream(self, fp):
+        """
+        Write all generated blocks to an open binary file object.
+
+        Same content as save(), streamed block by block instead of joining
+        the whole program into one string first.
+
+        Args:
+            fp: Writable binary file object (e.g. open(path, "wb"), io.BytesIO)
+        """
+        write = fp.write
+        for i, (_, _, data) in enumerate(self._blocks):
+            if i:
+                write(_NEWLINE)
+            write(data)
+
     def save_separate(self, directory: str):
         """
         Save each block as a separate .scl file.
@@ -336,10 +436,9 @@ class SclGenerator:
         """
         dir_path = Path(directory)
         dir_path.mkdir(parents=True, exist_ok=True)
-        for name, text in self._blocks:
-            safe_name = name.replace('"', "").replace(" ", "_")
-            filepath = dir_path / f"{safe_name}.scl"
-            filepath.write_text(text, encoding="utf-8")
+        for name, _, data in self._blocks:
+            safe_name = name.translate(_SAFE_NAME)
+            _write_file(dir_path / f"{safe_name}.scl", data)
         print(f"Saved {len(self._blocks)} block(s) to {dir_path}/")
 
     def clear(self):
@@ -348,57 +447,87 @@ class SclGenerator:
 
     # ── Internal Helpers ──────────────────────────────────────────────────────
 
-    def _attributes(self) -> str:
-        """Generate the S7 attribute pragma."""
-        if self.optimized:
-            return "{ S7_Optimized_Access := 'TRUE' }"
-        return "{ S7_Optimized_Access := 'FALSE' }"
+    def _add_block(self, name: str, text: str) -> str:
+        """Record a generated block (encoded once for all save methods) and return its text."""
+        if os.linesep != "\n":
+            data = text.replace("\n", os.linesep).encode("utf-8")
+        else:
+            data = text.encode("utf-8")
+        self._blocks.append((name, text, data))
+        return text
 
-    def _var_sections(self, members: list[MemberDef], order: list[str]) -> list[str]:
+    def _var_sections(self, members: list[MemberDef], order: tuple) -> list[str]:
         """Group members by section and format as VAR blocks."""
+        # Bucket members in one pass (keeping their order), then emit in section order
+        buckets = {}
+        for m in members:
+            buckets.setdefault(m.section, []).append(m)
+
         lines = []
-        for section in order:
-            section_members = [m for m in members if m.section == section]
+        append = lines.append
+        member_line = self._member_line
+        for section, kw in order:
+            section_members = buckets.get(section)
             if not section_members:
                 continue
-            kw = _SECTION_KW.get(section, "VAR")
-            lines.append("")
-            lines.append(kw)
-            for m in section_members:
-                lines.append(self._member_line(m))
-            lines.append("END_VAR")
+            append("")
+            append(kw)
+            lines.extend(member_line(m) for m in section_members)
+            append("END_VAR")
         return lines
 
     def _member_line(self, m: MemberDef) -> str:
         """Format a single member as an SCL variable declaration line."""
         # Data type string
-        if m.data_type == "Array" and m.array_type:
+        dtype = m.data_type
+        if dtype == "Array" and m.array_type:
             lower = m.array_lower if m.array_lower is not None else 0
             upper = m.array_upper if m.array_upper is not None else 0
             dtype = f"Array[{lower}..{upper}] of {m.array_type}"
-        else:
-            dtype = m.data_type
-
-        # Build line
-        line = f"    {m.name} : {dtype}"
-        if m.initial_value:
-            line += f" := {m.initial_value}"
-        line += ";"
-
-        # Comment
-        if m.comment:
-            line += f"   // {m.comment}"
 
-        return line
+        # One f-string per combination of optional initial value / comment
+        iv = m.initial_value
+        comment = m.comment
+        if iv and comment:
+            return f"    {m.name} : {dtype} := {iv};   {_line_comment(comment)}"
+        if iv:
+            return f"    {m.name} : {dtype} := {iv};"
+        if comment:
+            return f"    {m.name} : {dtype};   {_line_comment(comment)}"
+        return f"    {m.name} : {dtype};"
 
     def _format_code(self, code: str) -> str:
         """Clean up and indent user-provided SCL code."""
         if not code or not code.strip():
             return "    ;"
-        # Dedent and re-indent with 4 spaces
-        cleaned = dedent(code).strip()
-        indented = "\n".join(f"    {line}" if line.strip() else "" for line in cleaned.splitlines())
-        return indented
+        return _indent_code(code)
+
+
+# ─── Formatting ───────────────────────────────────────────────────────────────
+
+def _line_comment(comment: str) -> str:
+    """Format an SCL line comment, keeping comments that already start with //."""
+    return comment if comment.startswith("//") else f"// {comment}"
+
+
+@functools.lru_cache(maxsize=256)
+def _indent_code(code: str) -> str:
+    """Dedent and re-indent SCL code with 4 spaces (cached: the same body is often reused)."""
+    cleaned = dedent(code).strip()
+    return "\n".join(f"    {line}" if line.strip() else "" for line in cleaned.splitlines())
+
+
+# ─── File Output ──────────────────────────────────────────────────────────────
+
+def _write_file(path: Path, data: bytes):
+    """Write data to path with a single unbuffered file descriptor."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 # ─── CLI ──────────────────────────────────────────────────────────────────────
@@ -515,7 +644,7 @@ def _generate_examples():
     scl.save_separate(str(output_dir / "separate"))
 
     print(f"\nGenerated {len(scl._blocks)} blocks:")
-    for name, _ in scl._blocks:
+    for name, _, _ in scl._blocks:
         print(f"  - {name}")
 
 
@@ -24,13 +24,24 @@ Usage:
 """
 
 import csv
+import itertools
+import mmap
+import operator
+import os
 import re
-import zlib
-import xml.etree.ElementTree as ET
+import sys
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from pathlib import Path
+from xml.sax.saxutils import escape
 from dataclasses import dataclass, field
 from typing import Optional
 
+try:
+    from .tia_project_reader import scan_zlib_streams
+except ImportError:  # Run as a script: python tia_tag_export.py ...
+    from tia_project_reader import scan_zlib_streams
+
 
 # ─── RID → Data Type Mapping ─────────────────────────────────────────────────
 
@@ -79,9 +90,41 @@ RID_TYPE_MAP = {
 }
 
 
+# ─── Parser Patterns ──────────────────────────────────────────────────────────
+
+_SECTION_NAMES = ("Input", "Output", "InOut", "Static", "Temp", "Constant")
+# Map parsed or imported section names onto the shared literals above, so tags
+# share one string per section (cached hash, identity fast path in ==)
+_SECTIONS = {name: name for name in _SECTION_NAMES}
+_SECTIONS_BY_BYTES = {name.encode("ascii"): name for name in _SECTION_NAMES}
+
+# Page patterns match the raw bytes; only captured values are decoded
+# Any mention of a section name; _section_spans() classifies the hits
+_SECTION_NAME_RE = re.compile(rb'Name="(Input|Output|InOut|Static|Temp|Constant)"')
+# Data member: carries an RID attribute, unlike section headers
+_MEMBER_RE = re.compile(
+    rb'<Member\s+ID="(\d+)"\s+Name="([^"]+)"\s+RID="([^"]+)"'
+    rb'(?:\s+Type="([^"]+)")?'
+    rb'(?:\s+SubPartIndex="[^"]*")?'
+    rb'(?:\s+StdO="(\d+)")?'
+    rb'(?:\s+LID="(\d+)")?'
+)
+_EXT_TYPE_RE = re.compile(rb'ExternalType[^>]*Name="([^"]+)"')
+_FIRST_MEMBERS_RE = re.compile(rb'Member[^>]*Name="([^"]+)"')
+
+
+def _intern_section(section):
+    """Return the shared literal for a known section name, else section unchanged."""
+    return _SECTIONS.get(section, section)
+
+
 # ─── Data Classes ─────────────────────────────────────────────────────────────
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them (3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TagEntry:
     """Represents a single tag or variable."""
     block_name: str = ""
@@ -109,8 +152,22 @@ class TagEntry:
             "Group": self.group,
         }
 
+    def to_row(self) -> list:
+        """Values in CSV_HEADER order (same as to_dict(), without the keys)."""
+        return [
+            self.block_name, self.section, self.name, self.data_type, self.address,
+            self.offset if self.offset >= 0 else "",
+            self.initial_value, self.comment, self.group,
+        ]
+
 
 CSV_HEADER = ["Block", "Section", "Name", "DataType", "Address", "Offset", "InitialValue", "Comment", "Group"]
+# import_csv columns in TagEntry order, with the value used when a column is absent
+_CSV_IMPORT_COLUMNS = (
+    ("Block", ""), ("Section", "Static"), ("Name", ""), ("DataType", ""), ("Address", ""),
+    ("Offset", ""), ("InitialValue", ""), ("Comment", ""), ("Group", ""),
+)
+_CSV_BUFFER_SIZE = 1 << 20
 
 
 # ─── Exporter ─────────────────────────────────────────────────────────────────
@@ -134,8 +191,15 @@ class TiaTagExporter:
         if not plf_path.exists():
             raise FileNotFoundError(f"PEData.plf not found: {plf_path}")
 
-        data = plf_path.read_bytes()
-        blocks = self._extract_zlib_blocks(data)
+        with open(plf_path, "rb") as f:
+            # Map instead of read: the OS pages in only what the scan touches.
+            # The decompressed blocks are copies, so the map is closed before
+            # parsing. mmap cannot map an empty file, which is scanned as b"".
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    blocks = self._extract_zlib_blocks(data)
+            else:
+                blocks = self._extract_zlib_blocks(b"")
 
         # Parse block interfaces from XML data pages
         self._parse_block_interfaces(blocks)
@@ -157,11 +221,10 @@ class TiaTagExporter:
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_HEADER, delimiter=delimiter)
-            writer.writeheader()
-            for tag in self._tags:
-                writer.writerow(tag.to_dict())
+        with open(path, "w", newline="", encoding="utf-8-sig", buffering=_CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f, delimiter=delimiter)
+            writer.writerow(CSV_HEADER)
+            writer.writerows(tag.to_row() for tag in self._tags)
 
         print(f"Exported {len(self._tags)} tags to {path}")
 
@@ -174,24 +237,32 @@ class TiaTagExporter:
         """
         try:
             from openpyxl import Workbook
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+            from openpyxl.styles.fonts import DEFAULT_FONT
+            from openpyxl.utils import get_column_letter
         except ImportError:
             raise ImportError("openpyxl is required for Excel export: pip install openpyxl")
 
         if not self._parsed:
             self.parse()
 
-        wb = Workbook()
+        # Write-only workbook: rows are streamed to the sheet XML as they are
+        # appended instead of being kept as Cell objects until save()
+        wb = Workbook(write_only=True)
 
-        # Group tags by block name
+        # Group tags by block name, counting sections for the overview on the way
         blocks: dict[str, list[TagEntry]] = {}
+        section_counts: dict[str, Counter] = defaultdict(Counter)
         for tag in self._tags:
             key = tag.block_name or "Unassigned"
             blocks.setdefault(key, []).append(tag)
+            section_counts[key][tag.section] += 1
 
         # Styles
         header_font = Font(bold=True, color="FFFFFF")
         header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        header_alignment = Alignment(horizontal="center")
         section_fills = {
             "Input": PatternFill(start_color="E2EFDA", fill_type="solid"),
             "Output": PatternFill(start_color="FCE4D6", fill_type="solid"),
@@ -204,62 +275,78 @@ class TiaTagExporter:
             top=Side(style="thin"), bottom=Side(style="thin"),
         )
 
-        first_sheet = True
+        # Register each cell style once as a named style: assigning font/fill/
+        # border per cell makes openpyxl hash and look up every style object
+        # again, assigning a named style only copies its precomputed style ids
+        header_style = NamedStyle(
+            name="TIA Header", font=header_font, fill=header_fill,
+            alignment=header_alignment, border=thin_border,
+        )
+        row_style = NamedStyle(name="TIA Tag", font=DEFAULT_FONT, border=thin_border)
+        section_styles = {
+            section: NamedStyle(name=f"TIA {section}", font=DEFAULT_FONT, fill=fill, border=thin_border)
+            for section, fill in section_fills.items()
+        }
+        for style in (header_style, row_style, *section_styles.values()):
+            wb.add_named_style(style)
+
+        # Overview sheet (write-only sheets keep creation order, so it goes first)
+        ws_overview = wb.create_sheet("Overview")
+        overview_header = []
+        for header in ("Block", "Variables", "Input", "Output", "Static"):
+            cell = WriteOnlyCell(ws_overview, value=header)
+            cell.font = Font(bold=True)
+            overview_header.append(cell)
+        ws_overview.append(overview_header)
+        for bname, btags in blocks.items():
+            counts = section_counts[bname]
+            ws_overview.append([bname, len(btags), counts["Input"], counts["Output"], counts["Static"]])
+
         for block_name, tags in blocks.items():
             # Sheet name: max 31 chars, no special chars
             sheet_name = re.sub(r'[\\/*?:\[\]]', '_', block_name)[:31]
-            if first_sheet:
-                ws = wb.active
-                ws.title = sheet_name
-                first_sheet = False
-            else:
-                ws = wb.create_sheet(sheet_name)
-
-            # Header row
-            for col, header in enumerate(CSV_HEADER, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal="center")
-                cell.border = thin_border
-
-            # Data rows
-            for row_idx, tag in enumerate(tags, 2):
-                values = list(tag.to_dict().values())
-                section = tag.section
-                for col, val in enumerate(values, 1):
-                    cell = ws.cell(row=row_idx, column=col, value=val)
-                    cell.border = thin_border
-                    if section in section_fills:
-                        cell.fill = section_fills[section]
+            ws = wb.create_sheet(sheet_name)
+
+            # Column widths and the frozen header must be set before the
+            # first row is written: collect the rows and their widest value
+            # per column in one pass
+            rows = []
+            col_max_len = [len(header) for header in CSV_HEADER]
+            for tag in tags:
+                values = tag.to_row()
+                rows.append(values)
+                for ci, val in enumerate(values):
+                    if val:
+                        val_len = len(str(val))
+                        if val_len > col_max_len[ci]:
+                            col_max_len[ci] = val_len
 
             # Auto-fit column widths
-            for col in range(1, len(CSV_HEADER) + 1):
-                max_len = len(CSV_HEADER[col - 1])
-                for row in range(2, len(tags) + 2):
-                    val = ws.cell(row=row, column=col).value
-                    if val:
-                        max_len = max(max_len, len(str(val)))
-                ws.column_dimensions[chr(64 + col)].width = min(max_len + 2, 50)
+            for col, max_len in enumerate(col_max_len, 1):
+                ws.column_dimensions[get_column_letter(col)].width = min(max_len + 2, 50)
 
             # Freeze header row
             ws.freeze_panes = "A2"
             # Auto-filter
-            ws.auto_filter.ref = f"A1:{chr(64 + len(CSV_HEADER))}{len(tags) + 1}"
-
-        # Overview sheet
-        ws_overview = wb.create_sheet("Overview", 0)
-        ws_overview.cell(row=1, column=1, value="Block").font = Font(bold=True)
-        ws_overview.cell(row=1, column=2, value="Variables").font = Font(bold=True)
-        ws_overview.cell(row=1, column=3, value="Input").font = Font(bold=True)
-        ws_overview.cell(row=1, column=4, value="Output").font = Font(bold=True)
-        ws_overview.cell(row=1, column=5, value="Static").font = Font(bold=True)
-        for row_idx, (bname, btags) in enumerate(blocks.items(), 2):
-            ws_overview.cell(row=row_idx, column=1, value=bname)
-            ws_overview.cell(row=row_idx, column=2, value=len(btags))
-            ws_overview.cell(row=row_idx, column=3, value=sum(1 for t in btags if t.section == "Input"))
-            ws_overview.cell(row=row_idx, column=4, value=sum(1 for t in btags if t.section == "Output"))
-            ws_overview.cell(row=row_idx, column=5, value=sum(1 for t in btags if t.section == "Static"))
+            ws.auto_filter.ref = f"A1:{get_column_letter(len(CSV_HEADER))}{len(tags) + 1}"
+
+            # Header row
+            header_cells = []
+            for header in CSV_HEADER:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.style = header_style.name
+                header_cells.append(cell)
+            ws.append(header_cells)
+
+            # Data rows
+            for tag, values in zip(tags, rows):
+                style_name = section_styles.get(tag.section, row_style).name
+                row_cells = []
+                for val in values:
+                    cell = WriteOnlyCell(ws, value=val)
+                    cell.style = style_name
+                    row_cells.append(cell)
+                ws.append(row_cells)
 
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -268,29 +355,19 @@ class TiaTagExporter:
 
     # ── Internal Parsing ──────────────────────────────────────────────────────
 
-    def _extract_zlib_blocks(self, data: bytes) -> list:
-        """Find and decompress all zlib blocks."""
-        blocks = []
-        i = 0
-        while i < len(data) - 2:
-            if data[i] == 0x78 and data[i + 1] in (0x01, 0x5E, 0x9C, 0xDA):
-                try:
-                    obj = zlib.decompressobj()
-                    dec = obj.decompress(data[i:])
-                    comp_sz = len(data[i:]) - len(obj.unused_data)
-                    if len(dec) >= 10:
-                        blocks.append({"offset": i, "data": dec, "size": len(dec)})
-                        i += comp_sz
-                        continue
-                except Exception:
-                    pass
-            i += 1
-        return blocks
+    def _extract_zlib_blocks(self, data) -> list:
+        """Find and decompress all zlib blocks (same scan as TiaProjectReader)."""
+        # Released on exit so a memory-mapped file can be closed afterwards
+        with memoryview(data) as mv:
+            return scan_zlib_streams(data, mv)
 
     def _parse_block_interfaces(self, blocks: list):
         """Extract all block interface members from XML data pages."""
         # Track which blocks we've seen to avoid duplicates
         seen_signatures = set()
+        # Pages repeated verbatim would parse to an already seen signature, so
+        # they are skipped before decoding and parsing
+        seen_pages = set()
 
         for blk in blocks:
             if blk["size"] != 4096:
@@ -298,14 +375,15 @@ class TiaTagExporter:
             data = blk["data"]
             if b"<Member " not in data or b"<Root RIdSlots" not in data and b"<Member><Member" not in data:
                 continue
-
-            text = data.decode("utf-8", errors="replace")
+            if data in seen_pages:
+                continue
+            seen_pages.add(data)
 
             # Determine block name from context
-            block_name = self._identify_block(data, text)
+            block_name = self._identify_block(data)
 
             # Parse sections and members
-            members = self._parse_members_xml(text, block_name)
+            members = self._parse_members_xml(data, block_name)
 
             # Deduplicate: use a signature based on member names
             if members:
@@ -315,7 +393,7 @@ class TiaTagExporter:
                 seen_signatures.add(sig)
                 self._tags.extend(members)
 
-    def _identify_block(self, data: bytes, text: str) -> str:
+    def _identify_block(self, data: bytes) -> str:
         """Try to identify the block name from context clues."""
         # Safety blocks
         if b"F_PROG_DAT" in data or b"F_RTG_DAT" in data:
@@ -330,12 +408,15 @@ class TiaTagExporter:
             return "F_CTRL_DB (Safety Data)"
 
         # Generic: look for external type references
-        ext_match = re.search(r'ExternalType[^>]*Name="([^"]+)"', text)
+        ext_match = _EXT_TYPE_RE.search(data)
         if ext_match:
-            return f"Block_ref_{ext_match.group(1)}"
+            return f"Block_ref_{ext_match.group(1).decode('utf-8', 'replace')}"
 
         # Look at member names for hints
-        first_members = re.findall(r'Member[^>]*Name="([^"]+)"', text)[:3]
+        first_members = [
+            m.group(1).decode("utf-8", "replace")
+            for m in itertools.islice(_FIRST_MEMBERS_RE.finditer(data), 2)
+        ]
         if first_members:
             joined = "_".join(first_members[:2])
             if len(joined) > 30:
@@ -344,96 +425,72 @@ class TiaTagExporter:
 
         return f"Block_0x{0:04x}"
 
-    def _parse_members_xml(self, text: str, block_name: str) -> list[TagEntry]:
-        """Parse <Member> elements from XML text."""
-        members = []
-
-        # Determine current section context
-        # Sections are defined by: <Member ID="2" Name="Input" SubPartIndex="0" />
-        section_map = {}
-        for m in re.finditer(
-            r'<Member\s+ID="(\d+)"\s+Name="(Input|Output|InOut|Static|Temp|Constant)"'
-            r'\s+SubPartIndex="(\d+)"',
-            text,
-        ):
-            section_map[m.group(1)] = m.group(2)
-
-        # Parse actual data members (they have RID attribute)
-        current_section = "Static"  # Default section
-
-        # Check if there's a section structure
-        # Members within a section parent have the section context
-        for section_name in ["Input", "Output", "InOut", "Static", "Temp", "Constant"]:
-            # Find section opening: Name="Static" ... n="130" ...>
-            pattern = rf'Name="{section_name}"[^>]*>'
-            section_match = re.search(pattern, text)
-            if not section_match:
+    @staticmethod
+    def _section_spans(data: bytes) -> list:
+        """Return (section, start, end) for each section in data, in _SECTION_NAMES order."""
+        # One scan over all section names: a section's member list starts after
+        # the '>' following its first mention and ends at the next header marker
+        # (Name="..." with SubPartIndex before the next '>') of another section
+        starts = {}
+        marks = []
+        for m in _SECTION_NAME_RE.finditer(data):
+            name = _SECTIONS_BY_BYTES[m.group(1)]
+            gt = data.find(b">", m.end())
+            if gt < 0:
+                gt = len(data)
+            elif name not in starts:
+                starts[name] = gt + 1
+            if data.find(b"SubPartIndex", m.end(), gt) >= 0:
+                marks.append((m.start(), name))
+
+        spans = []
+        for name in _SECTION_NAMES:
+            start = starts.get(name)
+            if start is None:
                 continue
+            end = next((pos for pos, other in marks if pos >= start and other != name), len(data))
+            spans.append((name, start, end))
+        return spans
 
-            # Find members that appear after this section marker
-            section_start = section_match.end()
-
-            # Find the next section or end
-            next_section = len(text)
-            for other_section in ["Input", "Output", "InOut", "Static", "Temp", "Constant"]:
-                if other_section == section_name:
-                    continue
-                other_pattern = rf'Name="{other_section}"[^>]*SubPartIndex'
-                other_match = re.search(other_pattern, text[section_start:])
-                if other_match:
-                    next_section = min(next_section, section_start + other_match.start())
-
-            section_text = text[section_start:next_section]
+    def _parse_members_xml(self, data: bytes, block_name: str) -> list[TagEntry]:
+        """Parse <Member> elements from an XML data page."""
+        members = []
+        append = members.append
+        rid_type = RID_TYPE_MAP.get
 
+        # Members within a section parent have the section context
+        for section_name, section_start, next_section in self._section_spans(data):
             # Extract members with RID (actual variables, not section headers)
-            for m in re.finditer(
-                r'<Member\s+ID="(\d+)"\s+Name="([^"]+)"\s+RID="([^"]+)"'
-                r'(?:\s+Type="([^"]+)")?'
-                r'(?:\s+SubPartIndex="[^"]*")?'
-                r'(?:\s+StdO="(\d+)")?'
-                r'(?:\s+LID="(\d+)")?',
-                section_text,
-            ):
-                rid = m.group(3).lower()
-                data_type = m.group(4) if m.group(4) else RID_TYPE_MAP.get(rid, rid)
-                offset = int(m.group(5)) if m.group(5) else -1
-
-                members.append(TagEntry(
+            for m in _MEMBER_RE.finditer(data, section_start, next_section):
+                member_id, name, rid, data_type, std_offset, _ = m.groups()
+                rid = rid.decode("utf-8", "replace").lower()
+                append(TagEntry(
                     block_name=block_name,
                     section=section_name,
-                    name=m.group(2),
-                    data_type=data_type,
-                    offset=offset,
-                    member_id=int(m.group(1)),
+                    name=name.decode("utf-8", "replace"),
+                    data_type=data_type.decode("utf-8", "replace") if data_type else rid_type(rid, rid),
+                    offset=int(std_offset) if std_offset else -1,
+                    member_id=int(member_id),
                     rid=rid,
                 ))
 
         # If no section structure found, parse all members as flat list
         if not members:
-            for m in re.finditer(
-                r'<Member\s+ID="(\d+)"\s+Name="([^"]+)"\s+RID="([^"]+)"'
-                r'(?:\s+Type="([^"]+)")?'
-                r'(?:\s+SubPartIndex="[^"]*")?'
-                r'(?:\s+StdO="(\d+)")?'
-                r'(?:\s+LID="(\d+)")?',
-                text,
-            ):
-                rid = m.group(3).lower()
-                data_type = m.group(4) if m.group(4) else RID_TYPE_MAP.get(rid, rid)
-                offset = int(m.group(5)) if m.group(5) else -1
-                name = m.group(2)
+            for m in _MEMBER_RE.finditer(data):
+                member_id, name, rid, data_type, std_offset, _ = m.groups()
 
                 # Skip section headers
-                if name in ("Input", "Output", "InOut", "Static", "Temp", "Constant", "Return"):
+                if name in (b"Input", b"Output", b"InOut", b"Static", b"Temp", b"Constant", b"Return"):
                     continue
 
-                members.append(TagEntry(
+                rid = rid.decode("utf-8", "replace").lower()
+                append(TagEntry(
                     block_name=block_name,
                     section="Static",
-                    name=name,
-                    data_type=data_type,
-                    offset=offset,
-                    member_id=int(m.group(1)),
+                    name=name.decode("utf-8", "replace"),
+                    data_type=data_type.decode("utf-8", "replace") if data_type else rid_type(rid, rid),
+                    offset=int(std_offset) if std_offset else -1,
+                    member_id=int(member_id),
                     rid=rid,
                 ))
 
@@ -461,21 +518,46 @@ class TiaTagImporter:
         """
         path = Path(filepath)
         with open(path, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            for row in reader:
-                tag = TagEntry(
-                    block_name=row.get("Block", ""),
-                    section=row.get("Section", "Static"),
-                    name=row.get("Name", ""),
-                    data_type=row.get("DataType", ""),
-                    address=row.get("Address", ""),
-                    offset=int(row["Offset"]) if row.get("Offset") and row["Offset"] != "" else -1,
-                    initial_value=row.get("InitialValue", ""),
-                    comment=row.get("Comment", ""),
-                    group=row.get("Group", ""),
-                )
-                if tag.name and tag.data_type:
-                    self._tags.append(tag)
+            reader = csv.reader(f, delimiter=delimiter)
+            header = next(reader, None)
+            if header is not None:
+                # Resolve the columns once instead of building a dict per row
+                # (csv.DictReader semantics: the last duplicate header wins, cells
+                # missing from short rows read as None, absent columns as defaults)
+                col_idx = {name: i for i, name in enumerate(header)}
+                width = len(header)
+                indices = []
+                extra = []
+                for column, default in _CSV_IMPORT_COLUMNS:
+                    if column in col_idx:
+                        indices.append(col_idx[column])
+                    else:
+                        indices.append(width + len(extra))
+                        extra.append(default)
+                fetch = operator.itemgetter(*indices)
+                append = self._tags.append
+
+                for row in reader:
+                    if not row:
+                        continue  # blank line
+                    if len(row) != width:
+                        row = row[:width] + [None] * (width - len(row))
+                    block, section, name, data_type, address, offset, initial_value, comment, group = (
+                        fetch(row + extra)
+                    )
+                    offset = int(offset) if offset else -1
+                    if name and data_type:
+                        append(TagEntry(
+                            block_name=block,
+                            section=_intern_section(section),
+                            name=name,
+                            data_type=data_type,
+                            address=address,
+                            offset=offset,
+                            initial_value=initial_value,
+                            comment=comment,
+                            group=group,
+                        ))
 
         print(f"Imported {len(self._tags)} tags from {path}")
 
@@ -497,17 +579,19 @@ class TiaTagImporter:
 
         for sname in sheets:
             ws = wb[sname]
-            rows = list(ws.iter_rows(values_only=True))
-            if not rows:
+            # Iterate lazily: the read-only sheet streams rows from the file
+            rows = ws.iter_rows(values_only=True)
+            header_row = next(rows, None)
+            if header_row is None:
                 continue
 
             # First row is header
-            header = [str(h) if h else "" for h in rows[0]]
-            for row in rows[1:]:
+            header = [str(h) if h else "" for h in header_row]
+            for row in rows:
                 row_dict = {header[i]: (row[i] if i < len(row) else "") for i in range(len(header))}
                 tag = TagEntry(
                     block_name=str(row_dict.get("Block", sname) or sname),
-                    section=str(row_dict.get("Section", "Static") or "Static"),
+                    section=_intern_section(str(row_dict.get("Section", "Static") or "Static")),
                     name=str(row_dict.get("Name", "") or ""),
                     data_type=str(row_dict.get("DataType", "") or ""),
                     address=str(row_dict.get("Address", "") or ""),
@@ -546,36 +630,34 @@ class TiaTagImporter:
         if not io_tags:
             io_tags = self._tags  # Fallback: use all tags
 
-        doc = ET.Element("Document")
-        ET.SubElement(doc, "Engineering", version="V14")
-
-        tag_table = ET.SubElement(doc, "SW.Tags.PlcTagTable", ID="0")
-        attr_list = ET.SubElement(tag_table, "AttributeList")
-        name_elem = ET.SubElement(attr_list, "Name")
-        name_elem.text = table_name
-
-        obj_list = ET.SubElement(tag_table, "ObjectList")
-
-        for idx, tag in enumerate(io_tags):
-            plc_tag = ET.SubElement(obj_list, "SW.Tags.PlcTag", ID=str(idx + 1))
-            tag_attrs = ET.SubElement(plc_tag, "AttributeList")
-
-            n = ET.SubElement(tag_attrs, "Name")
-            n.text = tag.name
-
-            dt = ET.SubElement(tag_attrs, "DataTypeName")
-            dt.text = tag.data_type
-
-            if tag.address:
-                addr = ET.SubElement(tag_attrs, "LogicalAddress")
-                addr.text = tag.address
+        with _open_xml(filepath) as xml:
+            xml.start("Document")
+            xml.leaf("Engineering", version="V14")
+
+            xml.start("SW.Tags.PlcTagTable", ID="0")
+            xml.start("AttributeList")
+            xml.leaf("Name", table_name)
+            xml.end()
+
+            xml.start("ObjectList")
+            for idx, tag in enumerate(io_tags):
+                xml.start("SW.Tags.PlcTag", ID=str(idx + 1))
+                xml.start("AttributeList")
+                xml.leaf("Name", tag.name)
+                xml.leaf("DataTypeName", tag.data_type)
+                if tag.address:
+                    xml.leaf("LogicalAddress", tag.address)
+                if tag.comment:
+                    xml.start("Comment")
+                    xml.leaf("MultiLanguageText", tag.comment, Lang=language)
+                    xml.end()
+                xml.end()
+                xml.end()
+            xml.end()
 
-            if tag.comment:
-                comment_elem = ET.SubElement(tag_attrs, "Comment")
-                ml = ET.SubElement(comment_elem, "MultiLanguageText", Lang=language)
-                ml.text = tag.comment
+            xml.end()
+            xml.end()
 
-        self._save_xml(doc, filepath)
         print(f"Generated tag table XML: {filepath} ({len(io_tags)} tags)")
 
     def generate_db_xml(self, filepath: str, db_name: str = "DB_Imported",
@@ -595,39 +677,30 @@ class TiaTagImporter:
         if not db_tags:
             db_tags = self._tags
 
-        doc = ET.Element("Document")
-        ET.SubElement(doc, "Engineering", version="V14")
-
-        block = ET.SubElement(doc, "SW.Blocks.GlobalDB", ID=str(db_number))
-        attr_list = ET.SubElement(block, "AttributeList")
+        with _open_xml(filepath) as xml:
+            xml.start("Document")
+            xml.leaf("Engineering", version="V14")
+
+            xml.start("SW.Blocks.GlobalDB", ID=str(db_number))
+            xml.start("AttributeList")
+            xml.leaf("Name", db_name)
+            xml.leaf("Number", str(db_number))
+            if not optimized:
+                xml.leaf("MemoryLayout", "Standard")
+
+            xml.start("Interface")
+            xml.start("Sections", xmlns=_INTERFACE_NS)
+            xml.start("Section", Name="Static")
+            for tag in db_tags:
+                self._write_member(xml, tag, language)
+            xml.end()
+            xml.end()
+            xml.end()
+
+            xml.end()
+            xml.end()
+            xml.end()
 
-        n = ET.SubElement(attr_list, "Name")
-        n.text = db_name
-        num = ET.SubElement(attr_list, "Number")
-        num.text = str(db_number)
-
-        if not optimized:
-            ml = ET.SubElement(attr_list, "MemoryLayout")
-            ml.text = "Standard"
-
-        interface = ET.SubElement(attr_list, "Interface")
-        sections = ET.SubElement(
-            interface, "Sections",
-            xmlns="http://www.siemens.com/automation/Openness/SW/Interface/v3",
-        )
-        static_section = ET.SubElement(sections, "Section", Name="Static")
-
-        for tag in db_tags:
-            member = ET.SubElement(static_section, "Member", Name=tag.name, Datatype=tag.data_type)
-            if tag.initial_value:
-                sv = ET.SubElement(member, "StartValue")
-                sv.text = tag.initial_value
-            if tag.comment:
-                comment_elem = ET.SubElement(member, "Comment")
-                ml = ET.SubElement(comment_elem, "MultiLanguageText", Lang=language)
-                ml.text = tag.comment
-
-        self._save_xml(doc, filepath)
         print(f"Generated DB XML: {filepath} ({len(db_tags)} variables)")
 
     def generate_fb_xml(self, filepath: str, fb_name: str = "FB_Imported",
@@ -643,51 +716,111 @@ class TiaTagImporter:
             language_code: Programming language (SCL, LAD, FBD)
             comment_lang: Comment language
         """
-        doc = ET.Element("Document")
-        ET.SubElement(doc, "Engineering", version="V14")
-
-        block = ET.SubElement(doc, "SW.Blocks.FB", ID=str(fb_number))
-        attr_list = ET.SubElement(block, "AttributeList")
-
-        n = ET.SubElement(attr_list, "Name")
-        n.text = fb_name
-        num = ET.SubElement(attr_list, "Number")
-        num.text = str(fb_number)
-        lang = ET.SubElement(attr_list, "ProgrammingLanguage")
-        lang.text = language_code
-
-        interface = ET.SubElement(attr_list, "Interface")
-        sections = ET.SubElement(
-            interface, "Sections",
-            xmlns="http://www.siemens.com/automation/Openness/SW/Interface/v3",
-        )
-
-        for section_name in ["Input", "Output", "InOut", "Static", "Temp", "Constant"]:
-            section_tags = [t for t in self._tags if t.section == section_name]
-            section = ET.SubElement(sections, "Section", Name=section_name)
-            for tag in section_tags:
-                member = ET.SubElement(section, "Member", Name=tag.name, Datatype=tag.data_type)
-                if tag.initial_value:
-                    sv = ET.SubElement(member, "StartValue")
-                    sv.text = tag.initial_value
-                if tag.comment:
-                    comment_elem = ET.SubElement(member, "Comment")
-                    ml = ET.SubElement(comment_elem, "MultiLanguageText", Lang=comment_lang)
-                    ml.text = tag.comment
+        # Sort the tags into their sections once instead of rescanning per section
+        by_section: dict[str, list[TagEntry]] = {name: [] for name in _SECTION_NAMES}
+        for tag in self._tags:
+            bucket = by_section.get(tag.section)
+            if bucket is not None:
+                bucket.append(tag)
+
+        with _open_xml(filepath) as xml:
+            xml.start("Document")
+            xml.leaf("Engineering", version="V14")
+
+            xml.start("SW.Blocks.FB", ID=str(fb_number))
+            xml.start("AttributeList")
+            xml.leaf("Name", fb_name)
+            xml.leaf("Number", str(fb_number))
+            xml.leaf("ProgrammingLanguage", language_code)
+
+            xml.start("Interface")
+            xml.start("Sections", xmlns=_INTERFACE_NS)
+            for section_name, section_tags in by_section.items():
+                xml.start("Section", Name=section_name)
+                for tag in section_tags:
+                    self._write_member(xml, tag, comment_lang)
+                xml.end()
+            xml.end()
+            xml.end()
+
+            xml.end()
+            xml.end()
+            xml.end()
 
-        self._save_xml(doc, filepath)
         print(f"Generated FB XML: {filepath} ({len(self._tags)} variables)")
 
     @staticmethod
-    def _save_xml(root: ET.Element, filepath: str):
-        """Save XML with proper formatting."""
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tree = ET.ElementTree(root)
-        ET.indent(tree, space="  ")
-        with open(path, "w", encoding="utf-8") as f:
-            f.write('<?xml version="1.0" encoding="utf-8"?>\n')
-            tree.write(f, encoding="unicode", xml_declaration=False)
+    def _write_member(xml: "_XmlWriter", tag: TagEntry, language: str):
+        """Write one interface <Member> with its start value and comment."""
+        xml.start("Member", Name=tag.name, Datatype=tag.data_type)
+        if tag.initial_value:
+            xml.leaf("StartValue", tag.initial_value)
+        if tag.comment:
+            xml.start("Comment")
+            xml.leaf("MultiLanguageText", tag.comment, Lang=language)
+            xml.end()
+        xml.end()
+
+
+# ─── XML Output ───────────────────────────────────────────────────────────────
+
+_INTERFACE_NS = "http://www.siemens.com/automation/Openness/SW/Interface/v3"
+_XML_ATTR_ENTITIES = {'"': "&quot;", "\r": "&#13;", "\n": "&#10;", "\t": "&#09;"}
+
+
+class _XmlWriter:
+    """
+    Streams XML element by element, indented with two spaces per level.
+
+    Produces the same layout as ElementTree with ET.indent(space="  "),
+    without holding the document in memory.
+    """
+
+    def __init__(self, f):
+        self._write = f.write
+        self._stack: list[str] = []
+        self._pending = False  # start tag written but not yet closed with '>'
+
+    def start(self, tag: str, **attrib):
+        """Open an element; children follow until the matching end()."""
+        self._begin(tag, attrib)
+        self._stack.append(tag)
+        self._pending = True
+
+    def end(self):
+        """Close the innermost open element (as <tag /> if it got no children)."""
+        tag = self._stack.pop()
+        if self._pending:
+            self._write(" />")
+            self._pending = False
+        else:
+            self._write(f"\n{'  ' * len(self._stack)}</{tag}>")
+
+    def leaf(self, tag: str, text: Optional[str] = None, **attrib):
+        """Write a complete element without children."""
+        self._begin(tag, attrib)
+        if text:
+            self._write(f">{escape(text)}</{tag}>")
+        else:
+            self._write(" />")
+
+    def _begin(self, tag: str, attrib: dict):
+        if self._pending:
+            self._write(">")
+            self._pending = False
+        indent = f"\n{'  ' * len(self._stack)}" if self._stack else ""
+        attrs = "".join(f' {k}="{escape(v, _XML_ATTR_ENTITIES)}"' for k, v in attrib.items())
+        self._write(f"{indent}<{tag}{attrs}")
+
+
+@contextmanager
+def _open_xml(filepath: str):
+    """Open filepath for writing and yield an _XmlWriter after the XML declaration."""
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        yield _XmlWriter(f)
 
 
 # ─── Convenience Functions ────────────────────────────────────────────────────